@@ -15,27 +15,126 @@ Testing Philosophy:
 - Documentation Accuracy: Live API validation
 """
 
+import io
 import os
+import sys
 import time
-import json
+import random
 import asyncio
 import threading
+import functools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, asdict
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import statistics
+from typing import Dict, List, NamedTuple, Optional, Any, Tuple
+from urllib.parse import urlencode, urlsplit
+from dataclasses import dataclass, field, replace
 
-import requests
+import aiohttp
+import numpy as np
+import orjson
 import pandas as pd
-from requests.adapters import HTTPAdapter
-from requests.packages.urllib3.util.retry import Retry
+
+try:
+    import ijson  # Optional - streaming validation for multi-MB payloads
+except ImportError:
+    ijson = None
+
+try:
+    import numba  # Optional - JIT-compiled stats kernel for large stress samples
+except ImportError:
+    numba = None
+
+if numba is not None:
+    @numba.njit(cache=True, fastmath=True)
+    def _stress_stats_kernel(times):
+        """One-pass mean/min/max plus nearest-rank p50/p95 over float64[:]"""
+        n = times.shape[0]
+        total = times[0]
+        lo = times[0]
+        hi = times[0]
+        for i in range(1, n):
+            t = times[i]
+            total += t
+            if t < lo:
+                lo = t
+            if t > hi:
+                hi = t
+        sorted_times = np.sort(times)
+        p50 = sorted_times[int(0.50 * (n - 1))]
+        p95 = sorted_times[int(0.95 * (n - 1))]
+        return total / n, lo, hi, p50, p95
+else:
+    def _stress_stats_kernel(times):
+        """NumPy fallback when numba is not installed"""
+        sorted_times = np.sort(times)
+        n = times.shape[0]
+        return (
+            float(times.mean()),
+            float(times.min()),
+            float(times.max()),
+            float(sorted_times[int(0.50 * (n - 1))]),
+            float(sorted_times[int(0.95 * (n - 1))])
+        )
+
+if numba is not None:
+    @numba.njit(cache=True, fastmath=True)
+    def _summary_agg_kernel(times):
+        """Mean, nearest-rank p95 and extrema indexes over float64[:]"""
+        n = times.shape[0]
+        total = times[0]
+        idx_min = 0
+        idx_max = 0
+        for i in range(1, n):
+            t = times[i]
+            total += t
+            if t < times[idx_min]:
+                idx_min = i
+            if t > times[idx_max]:
+                idx_max = i
+        p95 = np.sort(times)[int(0.95 * (n - 1))]
+        return total / n, p95, idx_min, idx_max
+else:
+    def _summary_agg_kernel(times):
+        """NumPy fallback when numba is not installed"""
+        n = times.shape[0]
+        return (
+            float(times.mean()),
+            float(np.sort(times)[int(0.95 * (n - 1))]),
+            int(times.argmin()),
+            int(times.argmax())
+        )
+
+# Endpoints whose payloads are large enough to stream-validate instead of
+# materializing thousands of protocol/pool dicts just to check field names
+STREAMING_ENDPOINTS = frozenset({"protocols_list", "yields_pools"})
+STREAMING_SIZE_THRESHOLD = 256 * 1024  # bytes
+
+_INDICATORS = ("[FAST]", "[MEDIUM]", "[SLOW]")
+
+@functools.lru_cache(maxsize=4096)
+def _pretty(name: str) -> str:
+    """Title-case an identifier for display; repeated names hit the cache"""
+    return name.replace("_", " ").title()
+
+# Fixed per-endpoint documentation block, formatted in one C-level call
+_ENDPOINT_TEMPLATE = """#### [{status}] {title}
+
+- **Status:** {status}
+- **Response Time:** {perf} {response_time:.1f}ms
+- **Data Size:** {data_size} bytes
+- **HTTP Status:** {http_status}"""
+
+# Status codes worth retrying (rate limits and transient server errors)
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_BACKOFF_JITTER = 0.3
 
 # ============================================================================
 # API CONFIGURATION & CREDENTIALS
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class APIConfig:
     """API configuration and credentials"""
     
@@ -64,11 +163,20 @@ class APIConfig:
 
 config = APIConfig()
 
+# Per-API documentation metadata (base_url, rate_limit, requires_auth),
+# built once instead of per helper call; DeFiLlama may be public
+_API_META = {
+    "coingecko": (config.coingecko_base_url, config.coingecko_rate_limit, True),
+    "defillama": (config.defillama_base_url, config.defillama_rate_limit, False),
+    "velo": (config.velo_base_url, config.velo_rate_limit, True),
+}
+_API_META_DEFAULT = ("Unknown", 0, False)
+
 # ============================================================================
 # API ENDPOINT DEFINITIONS
 # ============================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class APIEndpoint:
     """API endpoint definition with testing parameters"""
     name: str
@@ -80,9 +188,36 @@ class APIEndpoint:
     expected_fields: List[str]
     rate_limit_per_minute: int
     critical: bool = False  # Critical endpoints need < 200ms response time
-    
+
+    # Derived in __post_init__; slots need them declared as fields
+    _query: str = field(init=False, repr=False, default="")
+    _full_url: str = field(init=False, repr=False, default="")
+    _dict_cache: Dict[str, Any] = field(init=False, repr=False, default=None)
+
+    def __post_init__(self):
+        # Pre-encode the query string once so hot request paths reuse the
+        # full URL instead of re-urlencoding the same params on every call
+        # (booleans are lowercased to match what the APIs expect)
+        normalized = {k: str(v).lower() if isinstance(v, bool) else v for k, v in self.params.items()}
+        object.__setattr__(self, "_query", urlencode(normalized, doseq=True))
+        object.__setattr__(self, "_full_url", f"{self.url}?{self._query}" if self._query else self.url)
+
+        # Endpoints are immutable after construction, so serialize once here
+        # instead of paying asdict's recursive deep-copy walk per call
+        object.__setattr__(self, "_dict_cache", {
+            "name": self.name,
+            "method": self.method,
+            "url": self.url,
+            "headers": dict(self.headers),
+            "params": dict(self.params),
+            "description": self.description,
+            "expected_fields": list(self.expected_fields),
+            "rate_limit_per_minute": self.rate_limit_per_minute,
+            "critical": self.critical
+        })
+
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return self._dict_cache
 
 # ============================================================================
 # COINGECKO PRO API ENDPOINTS
@@ -330,7 +465,7 @@ class VeloDataAPI:
 # API TESTING FRAMEWORK
 # ============================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TestResult:
     """API test result data structure"""
     endpoint_name: str
@@ -342,90 +477,292 @@ class TestResult:
     missing_fields: List[str]
     error_message: Optional[str]
     timestamp: datetime
-    
+    stress_test_results: Optional[Dict[str, Any]] = None
+
     def to_dict(self) -> Dict[str, Any]:
+        # Flat fields - built inline rather than through asdict's deep copy
         return {
-            **asdict(self),
-            "timestamp": self.timestamp.isoformat()
+            "endpoint_name": self.endpoint_name,
+            "success": self.success,
+            "status_code": self.status_code,
+            "response_time_ms": self.response_time_ms,
+            "data_size_bytes": self.data_size_bytes,
+            "expected_fields_found": self.expected_fields_found,
+            "missing_fields": self.missing_fields,
+            "error_message": self.error_message,
+            "timestamp": self.timestamp.isoformat(),
+            "stress_test_results": self.stress_test_results,
+            # Preformatted previews so the doc renderer never re-slices/joins
+            "fields_found_preview": ", ".join(self.expected_fields_found[:5]),
+            "fields_found_truncated": len(self.expected_fields_found) > 5,
+            "missing_fields_preview": ", ".join(self.missing_fields),
+            "error_preview": (
+                f"{self.error_message[:100]}..." if self.error_message and len(self.error_message) > 100
+                else self.error_message
+            )
         }
 
+class StressSample(NamedTuple):
+    """Single stress-test observation - tuple layout, no per-sample dict"""
+    status_code: int
+    response_time_ms: float
+    data_size_bytes: int
+
+class TokenBucket:
+    """Shared token-bucket rate limiter for concurrent request workers
+
+    All workers draw from one bucket, so the aggregate request rate matches
+    the endpoint's quota instead of being multiplied by the worker count.
+    """
+
+    def __init__(self, rate_limit_per_minute: int):
+        self.capacity = float(rate_limit_per_minute)
+        self.refill_rate = rate_limit_per_minute / 60.0
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int = 1) -> None:
+        """Block until the requested number of tokens is available"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+                self.last_refill = now
+
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+
+                wait_seconds = (tokens - self.tokens) / self.refill_rate
+
+            time.sleep(wait_seconds)
+
+    async def acquire_async(self, tokens: int = 1) -> None:
+        """Async variant of acquire for event-loop callers"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+                self.last_refill = now
+
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+
+                wait_seconds = (tokens - self.tokens) / self.refill_rate
+
+            await asyncio.sleep(wait_seconds)
+
+class EndpointTable:
+    """Struct-of-Arrays view over all API endpoint definitions
+
+    Parallel columns keep the dispatch loop on contiguous data and turn
+    critical-endpoint selection into one vectorized mask instead of a
+    per-object attribute scan. The APIEndpoint objects are kept as row
+    views for the request path.
+    """
+
+    def __init__(self, apis: Dict[str, Any]):
+        self.endpoints: List[APIEndpoint] = []
+        api_names = []
+        names = []
+        criticals = []
+
+        for api_name, api_instance in apis.items():
+            for endpoint in api_instance.endpoints:
+                self.endpoints.append(endpoint)
+                api_names.append(api_name)
+                names.append(endpoint.name)
+                criticals.append(endpoint.critical)
+
+        self.api_names = np.array(api_names, dtype=object)
+        self.names = np.array(names, dtype=object)
+        self.critical_mask = np.array(criticals, dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self.endpoints)
+
 class APITester:
     """Comprehensive API testing and validation framework"""
-    
+
     def __init__(self):
-        self.session = requests.Session()
-        
-        # Configure robust retry strategy
-        retry_strategy = Retry(
-            total=config.max_retries,
-            backoff_factor=0.5,
-            status_forcelist=[429, 500, 502, 503, 504]
-        )
-        
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
-        
+        # Shared aiohttp session, created inside test_all_apis' event loop;
+        # both the probe path and the stress driver multiplex over its
+        # keep-alive connection pool
+        self.async_session: Optional[aiohttp.ClientSession] = None
+
         self.test_results = []
         self.performance_metrics = {}
-    
-    def test_endpoint(self, endpoint: APIEndpoint) -> TestResult:
+        self._rate_buckets: Dict[str, TokenBucket] = {}
+
+        # TTL cache of raw responses so repeated probes of the same
+        # (method, url, params) reuse the first payload instead of the network
+        self._response_cache: Dict[Tuple[str, str, str], Tuple[float, int, bytes, float]] = {}
+        self._response_cache_ttl = 60.0  # seconds
+
+        # Stress results keyed by full URL so duplicate non-critical
+        # destinations are not hammered twice in one run
+        self._stress_cache: Dict[str, Dict[str, Any]] = {}
+
+        # Progress lines accumulate in a ring buffer and hit stdout in
+        # batches, so concurrent tasks never serialize on the I/O lock
+        self._log_buffer: deque = deque(maxlen=10_000)
+        self._log_stop = threading.Event()
+        self._log_thread = threading.Thread(target=self._log_flusher, daemon=True)
+        self._log_thread.start()
+
+    def _log(self, message: str) -> None:
+        """Queue a progress line for the batched flusher"""
+        self._log_buffer.append(message)
+
+    def _flush_log(self) -> None:
+        """Drain the ring buffer to stdout in one write"""
+        lines = []
+        while True:
+            try:
+                lines.append(self._log_buffer.popleft())
+            except IndexError:
+                break
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
+
+    def _log_flusher(self) -> None:
+        """Daemon loop flushing queued progress lines once per second"""
+        while not self._log_stop.wait(1.0):
+            self._flush_log()
+        self._flush_log()
+
+    async def _warm_connections(self, endpoints: List[APIEndpoint]) -> None:
+        """Open one connection per unique host before any latency sampling
+
+        DNS resolution and the TLS handshake are paid here, outside the
+        timed probes, so first-request samples measure the API rather than
+        connection setup.
+        """
+        hosts = {urlsplit(endpoint.url).netloc for endpoint in endpoints}
+
+        async def warm(host: str) -> None:
+            try:
+                async with self.async_session.head(
+                    f"https://{host}/",
+                    timeout=aiohttp.ClientTimeout(total=config.request_timeout)
+                ) as response:
+                    await response.read()
+            except Exception:
+                pass  # Warm-up is best-effort; probes report real failures
+
+        await asyncio.gather(*(warm(host) for host in hosts))
+
+    def _bucket_for(self, endpoint: APIEndpoint) -> TokenBucket:
+        """Get (or create) the shared rate-limit bucket for an endpoint"""
+        bucket = self._rate_buckets.get(endpoint.name)
+        if bucket is None:
+            bucket = TokenBucket(endpoint.rate_limit_per_minute)
+            self._rate_buckets[endpoint.name] = bucket
+        return bucket
+
+    async def _request_with_retries(self, method: str, url: str, headers: Dict[str, str]) -> Tuple[int, bytes]:
+        """Issue a request, retrying 429s and transient 5xx with jittered backoff
+
+        Successor to the urllib3 Retry policy from the sync-session era:
+        retries honor any server-provided Retry-After window and each wait is
+        jittered by +/-30% so concurrent tasks don't retry in lockstep.
+        """
+        attempt = 0
+        while True:
+            async with self.async_session.request(
+                method=method,
+                url=url,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=config.request_timeout)
+            ) as response:
+                status_code = response.status
+                content = await response.read()
+                retry_after = response.headers.get("Retry-After")
+
+            if status_code not in RETRYABLE_STATUS_CODES or attempt >= config.max_retries:
+                return status_code, content
+
+            backoff = RETRY_BACKOFF_FACTOR * (2 ** attempt)
+            if retry_after is not None:
+                try:
+                    backoff = max(backoff, float(retry_after))
+                except ValueError:
+                    pass
+
+            await asyncio.sleep(max(backoff * (1 + random.uniform(-RETRY_BACKOFF_JITTER, RETRY_BACKOFF_JITTER)), 0.0))
+            attempt += 1
+
+    async def test_endpoint(self, endpoint: APIEndpoint, bypass_cache: bool = False) -> TestResult:
         """Test single API endpoint comprehensively"""
-        print(f"Testing {endpoint.name}...")
-        
-        start_time = time.time()
-        
+        self._log(f"Testing {endpoint.name}...")
+
+        start_ns = time.perf_counter_ns()
+        cache_key = (endpoint.method, endpoint.url, orjson.dumps(endpoint.params, option=orjson.OPT_SORT_KEYS))
+
         try:
-            response = self.session.request(
-                method=endpoint.method,
-                url=endpoint.url,
-                headers=endpoint.headers,
-                params=endpoint.params,
-                timeout=config.request_timeout
-            )
-            
-            response_time_ms = (time.time() - start_time) * 1000
-            
+            cached = None if bypass_cache else self._response_cache.get(cache_key)
+            if cached is not None and time.monotonic() - cached[0] < self._response_cache_ttl:
+                _, status_code, content, response_time_ms = cached
+            else:
+                status_code, content = await self._request_with_retries(
+                    endpoint.method, endpoint._full_url, endpoint.headers
+                )
+
+                response_time_ms = (time.perf_counter_ns() - start_ns) / 1e6
+                self._response_cache[cache_key] = (time.monotonic(), status_code, content, response_time_ms)
+
             # Validate status code
-            if response.status_code != 200:
+            if status_code != 200:
                 return TestResult(
                     endpoint_name=endpoint.name,
                     success=False,
-                    status_code=response.status_code,
+                    status_code=status_code,
                     response_time_ms=response_time_ms,
                     data_size_bytes=0,
                     expected_fields_found=[],
                     missing_fields=endpoint.expected_fields,
-                    error_message=f"HTTP {response.status_code}: {response.text[:200]}",
+                    error_message=f"HTTP {status_code}: {content[:200].decode('utf-8', errors='replace')}",
                     timestamp=datetime.utcnow()
                 )
-            
-            # Parse JSON response
+
+            # Parse JSON response and validate expected fields
+            data_size_bytes = len(content)
             try:
-                data = response.json()
-                data_size_bytes = len(response.content)
+                if ijson is not None and (
+                    endpoint.name in STREAMING_ENDPOINTS or data_size_bytes > STREAMING_SIZE_THRESHOLD
+                ):
+                    # Large payload: scan parse events and stop early instead
+                    # of materializing the full object tree
+                    expected_fields_found, missing_fields = self._stream_validate_fields(
+                        content, endpoint.expected_fields
+                    )
+                else:
+                    data = orjson.loads(content)
+                    expected_fields_found, missing_fields = self._validate_response_fields(
+                        data, endpoint.expected_fields
+                    )
             except ValueError as e:
                 return TestResult(
                     endpoint_name=endpoint.name,
                     success=False,
-                    status_code=response.status_code,
+                    status_code=status_code,
                     response_time_ms=response_time_ms,
-                    data_size_bytes=len(response.content),
+                    data_size_bytes=data_size_bytes,
                     expected_fields_found=[],
                     missing_fields=endpoint.expected_fields,
                     error_message=f"Invalid JSON response: {str(e)}",
                     timestamp=datetime.utcnow()
                 )
-            
-            # Validate expected fields
-            expected_fields_found, missing_fields = self._validate_response_fields(data, endpoint.expected_fields)
-            
+
             success = len(missing_fields) == 0
-            
+
             result = TestResult(
                 endpoint_name=endpoint.name,
                 success=success,
-                status_code=response.status_code,
+                status_code=status_code,
                 response_time_ms=response_time_ms,
                 data_size_bytes=data_size_bytes,
                 expected_fields_found=expected_fields_found,
@@ -436,12 +773,12 @@ class APITester:
             
             # Log performance for critical endpoints
             if endpoint.critical and response_time_ms > 200:
-                print(f"WARNING: Critical endpoint {endpoint.name} exceeded 200ms target: {response_time_ms:.1f}ms")
+                self._log(f"WARNING: Critical endpoint {endpoint.name} exceeded 200ms target: {response_time_ms:.1f}ms")
             
             return result
             
         except Exception as e:
-            response_time_ms = (time.time() - start_time) * 1000
+            response_time_ms = (time.perf_counter_ns() - start_ns) / 1e6
             return TestResult(
                 endpoint_name=endpoint.name,
                 success=False,
@@ -454,84 +791,94 @@ class APITester:
                 timestamp=datetime.utcnow()
             )
     
-    def stress_test_endpoint(self, endpoint: APIEndpoint, duration_seconds: int = 30, concurrent_requests: int = 5) -> Dict[str, Any]:
-        """Stress test endpoint with concurrent requests"""
-        print(f"Stress testing {endpoint.name} for {duration_seconds}s with {concurrent_requests} concurrent requests...")
-        
+    async def stress_test_endpoint(self, endpoint: APIEndpoint, duration_seconds: int = 30, concurrent_requests: int = 5) -> Dict[str, Any]:
+        """Stress test endpoint with concurrent requests on the event loop
+
+        A single-thread asyncio driver replaces the former ThreadPoolExecutor:
+        network I/O is the only blocking operation here, so OS threads added
+        stack and GIL overhead without any extra throughput.
+        """
+        # Reuse stats for a destination already stressed this run; critical
+        # endpoints always get a fresh measurement
+        cached_stats = self._stress_cache.get(endpoint._full_url)
+        if cached_stats is not None and not endpoint.critical:
+            self._log(f"Reusing stress results for {endpoint.name} (same destination already tested)")
+            return {**cached_stats, "endpoint_name": endpoint.name}
+
+        self._log(f"Stress testing {endpoint.name} for {duration_seconds}s with {concurrent_requests} concurrent requests...")
+
         results = []
         errors = []
-        start_time = time.time()
-        
-        def make_request():
-            """Make a single request"""
-            try:
-                request_start = time.time()
-                response = self.session.request(
-                    method=endpoint.method,
-                    url=endpoint.url,
-                    headers=endpoint.headers,
-                    params=endpoint.params,
-                    timeout=config.request_timeout
-                )
-                request_time = (time.time() - request_start) * 1000
-                
-                return {
-                    "success": True,
-                    "status_code": response.status_code,
-                    "response_time_ms": request_time,
-                    "data_size_bytes": len(response.content)
-                }
-            except Exception as e:
-                request_time = (time.time() - request_start) * 1000
-                return {
-                    "success": False,
-                    "error": str(e),
-                    "response_time_ms": request_time,
-                    "data_size_bytes": 0
-                }
-        
-        def worker():
-            """Worker function for concurrent requests"""
-            while time.time() - start_time < duration_seconds:
-                result = make_request()
-                if result["success"]:
-                    results.append(result)
-                else:
-                    errors.append(result)
-                time.sleep(60 / endpoint.rate_limit_per_minute)  # Respect rate limits
-        
-        # Start concurrent workers
-        with ThreadPoolExecutor(max_workers=concurrent_requests) as executor:
-            futures = [executor.submit(worker) for _ in range(concurrent_requests)]
-            
-            for future in as_completed(futures, timeout=duration_seconds + 10):
+        bucket = self._bucket_for(endpoint)
+        semaphore = asyncio.Semaphore(concurrent_requests)
+        start_time = time.perf_counter()
+
+        async def make_request():
+            """Make a single rate-limited request"""
+            async with semaphore:
+                await bucket.acquire_async()  # Respect rate limits across all tasks
+                request_start_ns = time.perf_counter_ns()
                 try:
-                    future.result()
+                    status_code, content = await self._request_with_retries(
+                        endpoint.method, endpoint._full_url, endpoint.headers
+                    )
+
+                    request_time = (time.perf_counter_ns() - request_start_ns) / 1e6
+                    results.append(StressSample(
+                        status_code=status_code,
+                        response_time_ms=request_time,
+                        data_size_bytes=len(content)
+                    ))
                 except Exception as e:
-                    print(f"Worker error: {e}")
-        
-        # Calculate statistics
+                    request_time = (time.perf_counter_ns() - request_start_ns) / 1e6
+                    errors.append({
+                        "success": False,
+                        "error": str(e),
+                        "response_time_ms": request_time,
+                        "data_size_bytes": 0
+                    })
+
+        # Spawn tasks at the bucket's refill cadence until the run deadline;
+        # the semaphore caps in-flight requests, the bucket enforces the quota
+        tasks = []
+        spawn_interval = 1.0 / bucket.refill_rate
+        while time.perf_counter() - start_time < duration_seconds:
+            tasks.append(asyncio.create_task(make_request()))
+            await asyncio.sleep(spawn_interval)
+
+        if tasks:
+            await asyncio.gather(*tasks)
+
+        # Calculate statistics (vectorized - one pass over contiguous arrays
+        # instead of repeated Python-level reductions and a full sort)
         if results:
-            response_times = [r["response_time_ms"] for r in results]
-            data_sizes = [r["data_size_bytes"] for r in results]
-            
+            response_times = np.fromiter(
+                (sample.response_time_ms for sample in results), dtype=np.float64, count=len(results)
+            )
+            data_sizes = np.fromiter(
+                (sample.data_size_bytes for sample in results), dtype=np.float64, count=len(results)
+            )
+
+            avg_response_time, min_time, max_time, p50, p95 = _stress_stats_kernel(response_times)
+            success_rate = len(results) / (len(results) + len(errors)) * 100
+
             stats = {
                 "endpoint_name": endpoint.name,
                 "duration_seconds": duration_seconds,
                 "total_requests": len(results) + len(errors),
                 "successful_requests": len(results),
                 "failed_requests": len(errors),
-                "success_rate": len(results) / (len(results) + len(errors)) * 100,
+                "success_rate": success_rate,
                 "requests_per_second": len(results) / duration_seconds,
-                "avg_response_time_ms": statistics.mean(response_times),
-                "min_response_time_ms": min(response_times),
-                "max_response_time_ms": max(response_times),
-                "p50_response_time_ms": statistics.median(response_times),
-                "p95_response_time_ms": sorted(response_times)[int(len(response_times) * 0.95)] if len(response_times) > 1 else response_times[0],
-                "avg_data_size_bytes": statistics.mean(data_sizes) if data_sizes else 0,
-                "total_data_transferred_mb": sum(data_sizes) / (1024 * 1024),
+                "avg_response_time_ms": float(avg_response_time),
+                "min_response_time_ms": float(min_time),
+                "max_response_time_ms": float(max_time),
+                "p50_response_time_ms": float(p50),
+                "p95_response_time_ms": float(p95),
+                "avg_data_size_bytes": float(data_sizes.mean()),
+                "total_data_transferred_mb": float(data_sizes.sum()) / (1024 * 1024),
                 "rate_limit_respected": len(results) <= (duration_seconds * endpoint.rate_limit_per_minute / 60),
-                "performance_grade": self._calculate_performance_grade(statistics.mean(response_times), len(results) / (len(results) + len(errors)) * 100)
+                "performance_grade": self._calculate_performance_grade(avg_response_time, success_rate)
             }
         else:
             stats = {
@@ -539,19 +886,20 @@ class APITester:
                 "error": "No successful requests",
                 "total_errors": len(errors)
             }
-        
+
+        self._stress_cache[endpoint._full_url] = stats
         return stats
     
-    def test_all_apis(self) -> Dict[str, Any]:
+    async def test_all_apis(self) -> Dict[str, Any]:
         """Test all API endpoints systematically"""
-        print("Starting comprehensive API testing...")
-        
+        self._log("Starting comprehensive API testing...")
+
         apis = {
             "coingecko": CoinGeckoProAPI(),
-            "defillama": DeFiLlamaProAPI(), 
+            "defillama": DeFiLlamaProAPI(),
             "velo": VeloDataAPI()
         }
-        
+
         all_results = {
             "test_summary": {
                 "start_time": datetime.utcnow().isoformat(),
@@ -562,31 +910,55 @@ class APITester:
             "api_results": {},
             "performance_summary": {}
         }
-        
-        for api_name, api_instance in apis.items():
-            print(f"\nTesting {api_name.upper()} API endpoints...")
-            
-            api_results = []
-            for endpoint in api_instance.endpoints:
-                # Basic functionality test
-                result = self.test_endpoint(endpoint)
-                api_results.append(result.to_dict())
-                
-                all_results["test_summary"]["total_endpoints"] += 1
-                if result.success:
-                    all_results["test_summary"]["successful_endpoints"] += 1
-                else:
-                    all_results["test_summary"]["failed_endpoints"] += 1
-                
-                # Stress test critical endpoints
-                if result.success and endpoint.critical:
-                    stress_stats = self.stress_test_endpoint(endpoint, duration_seconds=config.stress_test_duration)
-                    result.stress_test_results = stress_stats
-                
-                time.sleep(1)  # Brief pause between tests
-            
-            all_results["api_results"][api_name] = api_results
-        
+
+        table = EndpointTable(apis)
+
+        connector = aiohttp.TCPConnector(limit=64, limit_per_host=32, keepalive_timeout=75)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            self.async_session = session
+
+            # Amortize DNS + TLS setup before the timed probes start
+            await self._warm_connections(table.endpoints)
+
+            # Fan out all basic functionality tests concurrently over the table
+            self._log(f"\nTesting {len(table)} endpoints across {len(apis)} APIs...")
+            results = await asyncio.gather(
+                *(self.test_endpoint(endpoint) for endpoint in table.endpoints)
+            )
+
+            success_mask = np.fromiter((r.success for r in results), dtype=bool, count=len(results))
+
+            total_endpoints = len(table)
+            successful_endpoints = int(success_mask.sum())
+            all_results["test_summary"]["total_endpoints"] = total_endpoints
+            all_results["test_summary"]["successful_endpoints"] = successful_endpoints
+            all_results["test_summary"]["failed_endpoints"] = total_endpoints - successful_endpoints
+            all_results["test_summary"]["success_rate"] = (
+                successful_endpoints * 100.0 / total_endpoints if total_endpoints else 0.0
+            )
+
+            # Stress test critical endpoints that passed their basic probe.
+            # Deadline-based pacing: only sleep off whatever remains of the
+            # endpoint's rate-limit window instead of a blanket fixed pause
+            next_allowed_at = 0.0
+            for index in np.flatnonzero(table.critical_mask & success_mask):
+                endpoint = table.endpoints[index]
+                remaining = next_allowed_at - time.perf_counter()
+                if remaining > 0:
+                    await asyncio.sleep(remaining)
+
+                stress_stats = await self.stress_test_endpoint(endpoint, duration_seconds=config.stress_test_duration)
+                results[index] = replace(results[index], stress_test_results=stress_stats)
+                next_allowed_at = time.perf_counter() + 60 / endpoint.rate_limit_per_minute
+
+            # Group serialized results per API for the report
+            for api_name in apis:
+                api_indexes = np.flatnonzero(table.api_names == api_name)
+                all_results["api_results"][api_name] = [results[i].to_dict() for i in api_indexes]
+
+        self.async_session = None
+        self._flush_log()
+
         # Generate performance summary
         all_results["performance_summary"] = self._generate_performance_summary(all_results["api_results"])
         all_results["test_summary"]["end_time"] = datetime.utcnow().isoformat()
@@ -594,29 +966,55 @@ class APITester:
         return all_results
     
     def _validate_response_fields(self, data: Any, expected_fields: List[str]) -> Tuple[List[str], List[str]]:
-        """Validate that response contains expected fields"""
-        found_fields = []
-        missing_fields = []
-        
-        def check_nested_fields(obj, field_path=""):
-            """Recursively check nested object fields"""
+        """Validate that response contains expected fields
+
+        Iterative single-pass walk with set membership and early exit once
+        every expected field has been seen. Lists are sampled by their first
+        item, matching the previous recursive behavior.
+        """
+        expected = set(expected_fields)
+        found = set()
+
+        stack = deque([data])
+        while stack and found != expected:
+            obj = stack.popleft()
             if isinstance(obj, dict):
-                for key in obj.keys():
-                    full_path = f"{field_path}.{key}" if field_path else key
-                    if key in expected_fields or full_path in expected_fields:
-                        found_fields.append(key)
-                    check_nested_fields(obj[key], full_path)
-            elif isinstance(obj, list) and len(obj) > 0:
-                check_nested_fields(obj[0], field_path)  # Check first item in array
-        
-        check_nested_fields(data)
-        
-        for field in expected_fields:
-            if field not in found_fields:
-                missing_fields.append(field)
-        
+                for key, value in obj.items():
+                    if key in expected:
+                        found.add(key)
+                    stack.append(value)
+            elif isinstance(obj, list) and obj:
+                stack.append(obj[0])  # Check first item in array
+
+        found_fields = [field for field in expected_fields if field in found]
+        missing_fields = [field for field in expected_fields if field not in found]
+
         return found_fields, missing_fields
     
+    def _stream_validate_fields(self, content: bytes, expected_fields: List[str]) -> Tuple[List[str], List[str]]:
+        """Stream-validate expected fields over raw JSON bytes with ijson
+
+        Scans map_key events and aborts the stream as soon as every expected
+        field has been observed, so multi-MB payloads never become Python
+        object trees just to check a handful of field names.
+        """
+        expected = set(expected_fields)
+        found = set()
+
+        try:
+            for _, event, value in ijson.parse(io.BytesIO(content)):
+                if event == "map_key" and value in expected:
+                    found.add(value)
+                    if found == expected:
+                        break
+        except ijson.JSONError as e:
+            raise ValueError(str(e))
+
+        found_fields = [field for field in expected_fields if field in found]
+        missing_fields = [field for field in expected_fields if field not in found]
+
+        return found_fields, missing_fields
+
     def _calculate_performance_grade(self, avg_response_time: float, success_rate: float) -> str:
         """Calculate performance grade for endpoint"""
         score = 100
@@ -647,6 +1045,7 @@ class APITester:
             "api_performance": {},
             "overall_stats": {
                 "avg_response_time_ms": 0,
+                "p95_response_time_ms": 0,
                 "fastest_endpoint": {"name": "", "time_ms": float('inf')},
                 "slowest_endpoint": {"name": "", "time_ms": 0},
                 "highest_success_rate": {"name": "", "rate": 0},
@@ -654,176 +1053,283 @@ class APITester:
             }
         }
         
-        all_response_times = []
-        
-        for api_name, results in api_results.items():
-            api_times = [r["response_time_ms"] for r in results if r["success"]]
-            api_success_rate = len([r for r in results if r["success"]]) / len(results) * 100 if results else 0
-            
-            if api_times:
-                avg_time = statistics.mean(api_times)
-                all_response_times.extend(api_times)
-                
+        # One flat frame, then vectorized groupby reductions instead of
+        # repeated per-API list comprehensions
+        rows = [
+            {"api": api_name, "endpoint": r["endpoint_name"], "success": r["success"],
+             "response_time_ms": r["response_time_ms"]}
+            for api_name, results in api_results.items()
+            for r in results
+        ]
+        if not rows:
+            return summary
+
+        df = pd.DataFrame(rows)
+        endpoint_counts = df.groupby("api")["success"].agg(rate="mean", total="size")
+
+        successful = df[df["success"]]
+        if not successful.empty:
+            api_stats = successful.groupby("api")["response_time_ms"].agg(
+                avg="mean", fastest="min", slowest="max", successful="size"
+            )
+
+            for api_name, row in api_stats.iterrows():
+                api_success_rate = float(endpoint_counts.loc[api_name, "rate"]) * 100
+                avg_time = float(row["avg"])
+
                 summary["api_performance"][api_name] = {
                     "avg_response_time_ms": avg_time,
                     "success_rate": api_success_rate,
-                    "total_endpoints": len(results),
-                    "successful_endpoints": len([r for r in results if r["success"]]),
+                    "total_endpoints": int(endpoint_counts.loc[api_name, "total"]),
+                    "successful_endpoints": int(row["successful"]),
                     "performance_grade": self._calculate_performance_grade(avg_time, api_success_rate)
                 }
-                
-                # Track overall fastest/slowest
-                fastest_in_api = min(api_times)
-                slowest_in_api = max(api_times)
-                
-                if fastest_in_api < summary["overall_stats"]["fastest_endpoint"]["time_ms"]:
-                    summary["overall_stats"]["fastest_endpoint"] = {
-                        "name": f"{api_name} (fastest endpoint)",
-                        "time_ms": fastest_in_api
-                    }
-                
-                if slowest_in_api > summary["overall_stats"]["slowest_endpoint"]["time_ms"]:
-                    summary["overall_stats"]["slowest_endpoint"] = {
-                        "name": f"{api_name} (slowest endpoint)", 
-                        "time_ms": slowest_in_api
-                    }
-        
-        if all_response_times:
-            summary["overall_stats"]["avg_response_time_ms"] = statistics.mean(all_response_times)
-        
+
+            # Overall extrema/percentile in one pass over a contiguous array
+            times = np.ascontiguousarray(successful["response_time_ms"].to_numpy(dtype=np.float64))
+            avg_all, p95_all, idx_min, idx_max = _summary_agg_kernel(times)
+            idx_min = int(idx_min)
+            idx_max = int(idx_max)
+            endpoint_labels = successful["endpoint"].to_numpy()
+
+            summary["overall_stats"]["fastest_endpoint"] = {
+                "name": str(endpoint_labels[idx_min]),
+                "time_ms": float(times[idx_min])
+            }
+            summary["overall_stats"]["slowest_endpoint"] = {
+                "name": str(endpoint_labels[idx_max]),
+                "time_ms": float(times[idx_max])
+            }
+            summary["overall_stats"]["avg_response_time_ms"] = float(avg_all)
+            summary["overall_stats"]["p95_response_time_ms"] = float(p95_all)
+
         return summary
 
 # ============================================================================
 # DOCUMENTATION GENERATOR
 # ============================================================================
 
+def _compile_emitter(shape: Tuple[bool, bool, bool, bool]):
+    """Compile a per-endpoint emitter specialized to a result shape
+
+    `shape` records which optional blocks (fields found, missing fields,
+    errors, stress results) appear anywhere in an API's results. The generated
+    function only contains the branches that can actually fire, so all-pass
+    result sets skip the dead branch tests entirely.
+    """
+    has_fields, has_missing, has_error, has_stress = shape
+    src = [
+        "def emit(result, out):",
+        "    response_time = result['response_time_ms']",
+        "    status_label = 'PASS' if result['success'] else 'FAIL'",
+        "    out.write(_ENDPOINT_TEMPLATE.format_map({",
+        "        'status': status_label,",
+        "        'title': _pretty(result['endpoint_name']),",
+        "        'perf': _INDICATORS[(response_time >= 200) + (response_time >= 500)],",
+        "        'response_time': response_time,",
+        "        'data_size': result['data_size_bytes'],",
+        "        'http_status': result['status_code'],",
+        "    }))",
+        "    out.write('\\n')",
+    ]
+    if has_fields:
+        src += [
+            "    if result['expected_fields_found']:",
+            "        out.write(f\"- **Fields Found:** {result['fields_found_preview']}"
+            "{'...' if result['fields_found_truncated'] else ''}\\n\")",
+        ]
+    if has_missing:
+        src += [
+            "    if result['missing_fields']:",
+            "        out.write(f\"- **Missing Fields:** {result['missing_fields_preview']}\\n\")",
+        ]
+    if has_error:
+        src += [
+            "    if result['error_message']:",
+            "        out.write(f\"- **Error:** {result['error_preview']}\\n\")",
+        ]
+    if has_stress:
+        src += [
+            "    stress_results = result.get('stress_test_results')",
+            "    if stress_results:",
+            "        out.write(",
+            "            '\\n**Stress Test Results:**\\n'",
+            "            f\"- Requests/Second: {stress_results.get('requests_per_second', 0):.1f}\\n\"",
+            "            f\"- Success Rate: {stress_results.get('success_rate', 0):.1f}%\\n\"",
+            "            f\"- P95 Response Time: {stress_results.get('p95_response_time_ms', 0):.1f}ms\\n\"",
+            "            f\"- Performance Grade: {stress_results.get('performance_grade', 'N/A')}\\n\"",
+            "        )",
+        ]
+    src.append("    out.write('\\n')")
+
+    namespace = {"_ENDPOINT_TEMPLATE": _ENDPOINT_TEMPLATE, "_INDICATORS": _INDICATORS,
+                 "_pretty": _pretty}
+    exec(compile("\n".join(src), "<endpoint-emitter>", "exec"), namespace)
+    return namespace["emit"]
+
 class APIDocumentationGenerator:
     """Generate comprehensive API documentation from test results"""
-    
-    def __init__(self, test_results: Dict[str, Any]):
+
+    # Emitters compiled per result shape, shared across instances so repeated
+    # CI runs pay the codegen cost once per distinct shape
+    _EMITTERS: Dict[Tuple[bool, bool, bool, bool], Any] = {}
+
+    def __init__(self, test_results: Dict[str, Any], now: Optional[datetime] = None,
+                 verbose: bool = False):
         self.test_results = test_results
+        # verbose=True forces full per-endpoint blocks even for all-pass APIs
+        self.verbose = verbose
+        # One clock sample shared with the caller so the report header and the
+        # output filenames can never disagree across a second boundary
+        self.generated_at = (now or datetime.utcnow()).isoformat()
+        # Discover each API's result shape and bind its specialized emitter
+        self._api_emitters: Dict[str, Any] = {}
+        for api_name, results in test_results.get("api_results", {}).items():
+            shape = (
+                any(r["expected_fields_found"] for r in results),
+                any(r["missing_fields"] for r in results),
+                any(r["error_message"] for r in results),
+                any(r.get("stress_test_results") for r in results),
+            )
+            emitter = self._EMITTERS.get(shape)
+            if emitter is None:
+                emitter = self._EMITTERS[shape] = _compile_emitter(shape)
+            self._api_emitters[api_name] = emitter
     
     def generate_markdown_documentation(self) -> str:
-        """Generate comprehensive markdown documentation"""
-        doc_lines = [
-            "# SuperClaude API Documentation & Testing Report",
-            "",
-            "Comprehensive documentation and stress testing results for all integrated APIs in the SuperClaude GPT-5 Analytics framework.",
-            "",
-            f"**Generated:** {datetime.utcnow().isoformat()}",
-            "",
-            "## Test Summary",
-            "",
-            f"- **Total Endpoints Tested:** {self.test_results['test_summary']['total_endpoints']}",
-            f"- **Successful Tests:** {self.test_results['test_summary']['successful_endpoints']}",
-            f"- **Failed Tests:** {self.test_results['test_summary']['failed_endpoints']}",
-            f"- **Success Rate:** {(self.test_results['test_summary']['successful_endpoints'] / self.test_results['test_summary']['total_endpoints'] * 100):.1f}%",
-            "",
-            "## Performance Overview",
-            "",
-        ]
-        
+        """Generate comprehensive markdown documentation as one string"""
+        return "".join(self.iter_markdown())
+
+    def iter_markdown(self):
+        """Yield markdown chunks for streaming writes without a joined copy"""
+        summary = self.test_results["test_summary"]
+        total = summary["total_endpoints"]
+        successful = summary["successful_endpoints"]
+        success_rate = summary.get("success_rate", successful * 100.0 / total if total else 0.0)
+
+        out = io.StringIO()
+        out.write(
+            "# SuperClaude API Documentation & Testing Report\n"
+            "\n"
+            "Comprehensive documentation and stress testing results for all integrated APIs in the SuperClaude GPT-5 Analytics framework.\n"
+            "\n"
+            f"**Generated:** {self.generated_at}\n"
+            "\n"
+            "## Test Summary\n"
+            "\n"
+            f"- **Total Endpoints Tested:** {total}\n"
+            f"- **Successful Tests:** {successful}\n"
+            f"- **Failed Tests:** {summary['failed_endpoints']}\n"
+            f"- **Success Rate:** {success_rate:.1f}%\n"
+            "\n"
+            "## Performance Overview\n"
+            "\n"
+        )
+
         # Add performance summary
         perf_summary = self.test_results.get("performance_summary", {})
         if perf_summary:
-            doc_lines.extend([
-                f"- **Average Response Time:** {perf_summary.get('overall_stats', {}).get('avg_response_time_ms', 0):.1f}ms",
-                f"- **Fastest Endpoint:** {perf_summary.get('overall_stats', {}).get('fastest_endpoint', {}).get('name', 'N/A')} ({perf_summary.get('overall_stats', {}).get('fastest_endpoint', {}).get('time_ms', 0):.1f}ms)",
-                f"- **Slowest Endpoint:** {perf_summary.get('overall_stats', {}).get('slowest_endpoint', {}).get('name', 'N/A')} ({perf_summary.get('overall_stats', {}).get('slowest_endpoint', {}).get('time_ms', 0):.1f}ms)",
-                ""
-            ])
-        
-        # Document each API
-        for api_name, results in self.test_results.get("api_results", {}).items():
-            doc_lines.extend(self._generate_api_documentation(api_name, results))
-        
-        return "\n".join(doc_lines)
-    
-    def _generate_api_documentation(self, api_name: str, results: List[Dict]) -> List[str]:
-        """Generate documentation for specific API"""
-        api_title = api_name.replace("_", " ").title()
-        
-        doc_lines = [
-            f"## {api_title} API",
-            "",
-            f"**Base URL:** {self._get_base_url(api_name)}",
-            f"**Rate Limit:** {self._get_rate_limit(api_name)} requests/minute",
-            f"**Authentication:** {'API Key Required' if self._requires_auth(api_name) else 'Public API'}",
-            "",
-            "### Endpoints",
-            ""
-        ]
-        
+            stats = perf_summary.get("overall_stats") or {}
+            fastest = stats.get("fastest_endpoint") or {}
+            slowest = stats.get("slowest_endpoint") or {}
+            out.write(
+                f"- **Average Response Time:** {stats.get('avg_response_time_ms', 0):.1f}ms\n"
+                f"- **Fastest Endpoint:** {fastest.get('name', 'N/A')} ({fastest.get('time_ms', 0):.1f}ms)\n"
+                f"- **Slowest Endpoint:** {slowest.get('name', 'N/A')} ({slowest.get('time_ms', 0):.1f}ms)\n"
+                "\n"
+            )
+
+        yield out.getvalue()
+
+        # Document each API - sections are independent, so render them on a
+        # thread pool and yield in original iteration order (map preserves it)
+        api_results = self.test_results.get("api_results", {})
+        if len(api_results) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(api_results))) as executor:
+                yield from executor.map(self._render_api_section, api_results.items())
+        else:
+            for item in api_results.items():
+                yield self._render_api_section(item)
+
+    def _render_api_section(self, item: Tuple[str, List[Dict]]) -> str:
+        """Render one API's section into its own buffer"""
+        api_name, results = item
+        out = io.StringIO()
+        self._generate_api_documentation(api_name, results, out)
+        return out.getvalue()
+
+    def iter_markdown_bytes(self):
+        """Yield UTF-8 chunks, each encoded exactly once at construction"""
+        for chunk in self.iter_markdown():
+            yield chunk.encode('utf-8')
+
+    def _generate_api_documentation(self, api_name: str, results: List[Dict], out: io.StringIO) -> None:
+        """Write documentation for specific API into the given buffer"""
+        api_title = _pretty(api_name)
+        base_url, rate_limit, requires_auth = _API_META.get(api_name, _API_META_DEFAULT)
+
+        out.write(
+            f"## {api_title} API\n"
+            "\n"
+            f"**Base URL:** {base_url}\n"
+            f"**Rate Limit:** {rate_limit} requests/minute\n"
+            f"**Authentication:** {'API Key Required' if requires_auth else 'Public API'}\n"
+            "\n"
+            "### Endpoints\n"
+            "\n"
+        )
+
+        # All-pass APIs collapse to a one-line summary unless verbose output
+        # was requested - the common CI case skips the per-endpoint blocks
+        if not self.verbose and all(r["success"] for r in results):
+            times = [r["response_time_ms"] for r in results]
+            out.write(
+                f"All {len(results)} endpoints passed "
+                f"(avg {sum(times) / len(times):.1f}ms, max {max(times):.1f}ms)\n\n"
+            )
+            return
+
+        emit = self._api_emitters.get(api_name)
+        if emit is None:  # API absent at __init__ time - specialize on demand
+            shape = (
+                any(r["expected_fields_found"] for r in results),
+                any(r["missing_fields"] for r in results),
+                any(r["error_message"] for r in results),
+                any(r.get("stress_test_results") for r in results),
+            )
+            emit = self._EMITTERS.setdefault(shape, _compile_emitter(shape))
+            self._api_emitters[api_name] = emit
+
         for result in results:
-            status_emoji = "[PASS]" if result["success"] else "[FAIL]"
-            performance_indicator = "[FAST]" if result["response_time_ms"] < 200 else "[MEDIUM]" if result["response_time_ms"] < 500 else "[SLOW]"
-            
-            doc_lines.extend([
-                f"#### {status_emoji} {result['endpoint_name'].replace('_', ' ').title()}",
-                "",
-                f"- **Status:** {'PASS' if result['success'] else 'FAIL'}",
-                f"- **Response Time:** {performance_indicator} {result['response_time_ms']:.1f}ms",
-                f"- **Data Size:** {result['data_size_bytes']} bytes",
-                f"- **HTTP Status:** {result['status_code']}",
-            ])
-            
-            if result["expected_fields_found"]:
-                doc_lines.extend([
-                    f"- **Fields Found:** {', '.join(result['expected_fields_found'][:5])}{'...' if len(result['expected_fields_found']) > 5 else ''}",
-                ])
-            
-            if result["missing_fields"]:
-                doc_lines.extend([
-                    f"- **Missing Fields:** {', '.join(result['missing_fields'])}",
-                ])
-            
-            if result["error_message"]:
-                doc_lines.extend([
-                    f"- **Error:** {result['error_message'][:100]}{'...' if len(result['error_message']) > 100 else ''}",
-                ])
-            
-            # Add stress test results if available
-            if hasattr(result, 'stress_test_results'):
-                stress_results = result.stress_test_results
-                doc_lines.extend([
-                    "",
-                    "**Stress Test Results:**",
-                    f"- Requests/Second: {stress_results.get('requests_per_second', 0):.1f}",
-                    f"- Success Rate: {stress_results.get('success_rate', 0):.1f}%",
-                    f"- P95 Response Time: {stress_results.get('p95_response_time_ms', 0):.1f}ms",
-                    f"- Performance Grade: {stress_results.get('performance_grade', 'N/A')}",
-                ])
-            
-            doc_lines.append("")
-        
-        return doc_lines
-    
-    def _get_base_url(self, api_name: str) -> str:
-        """Get base URL for API"""
-        urls = {
-            "coingecko": config.coingecko_base_url,
-            "defillama": config.defillama_base_url,
-            "velo": config.velo_base_url
-        }
-        return urls.get(api_name, "Unknown")
+            emit(result, out)
     
-    def _get_rate_limit(self, api_name: str) -> int:
-        """Get rate limit for API"""
-        limits = {
-            "coingecko": config.coingecko_rate_limit,
-            "defillama": config.defillama_rate_limit,
-            "velo": config.velo_rate_limit
-        }
-        return limits.get(api_name, 0)
-    
-    def _requires_auth(self, api_name: str) -> bool:
-        """Check if API requires authentication"""
-        return api_name in ["coingecko", "velo"]  # DeFiLlama may be public
+    def _get_api_meta(self, api_name: str) -> Tuple[str, int, bool]:
+        """Get (base_url, rate_limit, requires_auth) for API in one lookup"""
+        return _API_META.get(api_name, _API_META_DEFAULT)
 
 # ============================================================================
 # MAIN TESTING EXECUTION
 # ============================================================================
 
+def _write_bytes(path: str, payload: bytes) -> None:
+    """Write a pre-serialized payload through a 64 KiB binary buffer"""
+    with open(path, 'wb', buffering=65536) as f:
+        f.write(payload)
+
+def _write_markdown(path: str, chunks) -> None:
+    """Stream pre-encoded markdown chunks to disk"""
+    with open(path, 'wb', buffering=65536) as f:
+        for chunk in chunks:
+            f.write(chunk)
+
+async def _write_outputs(results_path: str, results_payload: bytes,
+                         doc_path: str, doc_chunks) -> None:
+    """Dispatch both independent file writes concurrently"""
+    await asyncio.gather(
+        asyncio.to_thread(_write_bytes, results_path, results_payload),
+        asyncio.to_thread(_write_markdown, doc_path, doc_chunks),
+    )
+
 def run_comprehensive_api_testing():
     """Run comprehensive API testing and generate documentation"""
     print("SuperClaude Comprehensive API Testing Suite")
@@ -832,25 +1338,29 @@ def run_comprehensive_api_testing():
     # Initialize tester
     tester = APITester()
     
-    # Run all tests
-    test_results = tester.test_all_apis()
-    
-    # Generate documentation
-    doc_generator = APIDocumentationGenerator(test_results)
-    documentation = doc_generator.generate_markdown_documentation()
+    # Run all tests (endpoint probes fan out concurrently on one event loop)
+    test_results = asyncio.run(tester.test_all_apis())
     
+    # Generate documentation (single clock sample shared with the filenames)
+    now = datetime.utcnow()
+    doc_generator = APIDocumentationGenerator(test_results, now=now)
+
     # Save results
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    
-    # Save test results as JSON
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
+
+    # Save test results as JSON (orjson serializes the nested dicts in C)
     results_filename = f"api_test_results_{timestamp}.json"
-    with open(results_filename, 'w') as f:
-        json.dump(test_results, f, indent=2, default=str)
-    
-    # Save documentation as Markdown
+    results_payload = orjson.dumps(
+        test_results,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+        default=str,
+    )
+
+    # Save documentation as Markdown (streamed chunk by chunk, no joined copy);
+    # both files are independent, so their writes overlap in worker threads
     doc_filename = f"API_DOCUMENTATION_{timestamp}.md"
-    with open(doc_filename, 'w') as f:
-        f.write(documentation)
+    asyncio.run(_write_outputs(results_filename, results_payload,
+                               doc_filename, doc_generator.iter_markdown_bytes()))
     
     print(f"\nTesting completed successfully!")
     print(f"Test results saved to: {results_filename}")
@@ -862,10 +1372,10 @@ def run_comprehensive_api_testing():
     print(f"  Total endpoints: {summary['total_endpoints']}")
     print(f"  Successful: {summary['successful_endpoints']}")
     print(f"  Failed: {summary['failed_endpoints']}")
-    print(f"  Success rate: {(summary['successful_endpoints'] / summary['total_endpoints'] * 100):.1f}%")
+    print(f"  Success rate: {summary['success_rate']:.1f}%")
     
-    return test_results, documentation
+    return test_results, doc_filename
 
 if __name__ == "__main__":
     # Run the comprehensive API testing suite
-    results, docs = run_comprehensive_api_testing()
\ No newline at end of file
+    results, doc_path = run_comprehensive_api_testing()
\ No newline at end of file
@@ -13,13 +13,19 @@ Four Analysis Modules:
 Data Sources: CoinGecko Pro, DefiLlama, Velo Data
 """
 
+import heapq
 import time
+import orjson
 import pandas as pd
 import numpy as np
 import requests
 from datetime import datetime, timedelta
 from scipy import stats
-import json
+import re
+import types
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Optional
 import warnings
 warnings.filterwarnings('ignore')
@@ -42,10 +48,97 @@ DL_BASE = "https://api.llama.fi"
 CG_HEADERS = {"accept": "application/json", "x-cg-pro-api-key": COINGECKO_KEY}
 DL_HEADERS = {"accept": "application/json"}
 
+# Response-cache TTLs per endpoint path fragment; unmatched URLs use the default
+HTTP_CACHE_TTLS = {
+    "/coins/categories": 300,
+    "/yields": 180,
+    "/coins/markets": 60,
+}
+HTTP_CACHE_DEFAULT_TTL = 120
+
+# Constant narrative tables, built once at import instead of per call
+CATALYSTS = types.MappingProxyType({
+    'solana': 'Strong ecosystem growth and institutional adoption momentum',
+    'cardano': 'Recent governance upgrades and DeFi expansion',
+    'polygon': 'Layer 2 scaling solutions gaining enterprise traction',
+    'chainlink': 'Expanding oracle partnerships with traditional finance',
+    'avalanche': 'Subnet growth and institutional blockchain adoption',
+    'polkadot': 'Parachain auctions driving ecosystem development',
+    'cosmos': 'Inter-blockchain communication protocol expansion',
+    'near': 'Developer-friendly smart contract platform growth',
+    'algorand': 'Central bank digital currency partnerships',
+    'tezos': 'NFT marketplace and institutional adoption'
+})
+
+THESIS_MAP = types.MappingProxyType({
+    'defi': 'Yield farming renaissance and institutional DeFi adoption',
+    'layer 1': 'Blockchain scalability wars intensifying with new consensus mechanisms',
+    'ai': 'Artificial intelligence integration with blockchain infrastructure',
+    'gaming': 'GameFi 2.0 with sustainable tokenomics and AAA game launches',
+    'nft': 'Utility-focused NFTs and real-world asset tokenization',
+    'storage': 'Decentralized storage demand from enterprise and Web3 applications',
+    'oracle': 'Real-world data integration expanding beyond price feeds',
+    'privacy': 'Regulatory clarity driving institutional privacy coin adoption',
+    'metaverse': 'Virtual world infrastructure and digital real estate development',
+    'web3': 'Decentralized internet protocols gaining mainstream adoption'
+})
+# One scan to reject sector names with no thesis keyword; on a hit the
+# short map-order loop below picks the winning key
+_THESIS_RE = re.compile('|'.join(re.escape(key) for key in THESIS_MAP))
+
+# New/forked-protocol name check as a single compiled alternation
+_RED_RE = re.compile('new|fork', re.IGNORECASE)
+
+# Red-flag messages in the same order as the boolean columns built in
+# yield_pm_analysis
+_RED_FLAG_MESSAGES = (
+    "Unsustainably high APY - potential token emissions bubble",
+    "Low TVL - liquidity and exit risk",
+    "New/forked protocol - limited track record",
+    "Token concentration risk - limited diversification",
+    "Smart contract risk - recent deployment or upgrades",
+)
+
+@functools.lru_cache(maxsize=256)
+def _sector_thesis(sector_name: str) -> str:
+    """Thesis for a sector name; repeated sectors skip the keyword scan"""
+    name = sector_name.lower()
+    if _THESIS_RE.search(name):
+        # Map order decides priority when several keywords appear
+        return next(thesis for key, thesis in THESIS_MAP.items() if key in name)
+    return f"Strong fundamentals and momentum in {sector_name} ecosystem"
+
+@functools.lru_cache(maxsize=256)
+def _dip_thesis(asset_name: str, score_band: int) -> str:
+    """Dip thesis keyed on asset and score band (2 strong / 1 moderate / 0 early)"""
+    if score_band == 2:
+        return f"Strong leverage reset in {asset_name} with institutional accumulation zones"
+    elif score_band == 1:
+        return f"Moderate reset conditions with {asset_name} approaching value territory"
+    else:
+        return f"Early reset signals in {asset_name} requiring confirmation"
+
 class CryptoAnalysisSuite:
     def __init__(self):
         self.data_cache = {}
         self.analysis_results = {}
+        # TTL cache for HTTP responses - one suite run hits several endpoints
+        # (e.g. /protocols) from more than one module
+        self._http_cache = {}
+        self._http_cache_lock = threading.Lock()
+        # Protocol-risk classification tables, compiled once
+        self._bluechip_re = re.compile(r'aave|compound|uniswap|curve|convex')
+        self._established_chains = frozenset({'ethereum', 'polygon', 'arbitrum', 'optimism'})
+        # PCG64 generator for all mock draws - batch draws replace per-row
+        # trips through the legacy np.random dispatch layer
+        self._rng = np.random.default_rng()
+        # Shared session: keep-alive TLS connections to CoinGecko/DefiLlama
+        # instead of a fresh handshake per bare requests.get, with pool sizes
+        # large enough for the thread-pooled fan-outs
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=32)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
         
         if VELO_AVAILABLE:
             self.velo_client = velo.client(VELO_KEY)
@@ -54,13 +147,32 @@ class CryptoAnalysisSuite:
             
         print("[INIT] Crypto Analysis Suite - SuperClaude Framework")
 
+    def _cache_ttl_for(self, url: str) -> int:
+        """Pick the response TTL for a URL by endpoint path fragment"""
+        for fragment, ttl in HTTP_CACHE_TTLS.items():
+            if fragment in url:
+                return ttl
+        return HTTP_CACHE_DEFAULT_TTL
+
     def fetch_with_retries(self, url: str, headers: Dict, max_retries: int = 3) -> Optional[Dict]:
-        """Enhanced HTTP fetcher with exponential backoff"""
+        """Enhanced HTTP fetcher with exponential backoff and a TTL cache"""
+        cache_key = (url, tuple(sorted(headers.items())))
+        now = time.time()
+        with self._http_cache_lock:
+            hit = self._http_cache.get(cache_key)
+            if hit is not None and hit[1] > now:
+                return hit[0]
+
         for attempt in range(max_retries):
             try:
-                response = requests.get(url, headers=headers, timeout=30)
+                response = self._session.get(url, headers=headers, timeout=30)
                 if response.status_code == 200:
-                    return response.json()
+                    # Parse raw bytes with orjson - the /yields and /protocols
+                    # payloads run to several MB and stdlib json is the stall
+                    data = orjson.loads(response.content)
+                    with self._http_cache_lock:
+                        self._http_cache[cache_key] = (data, time.time() + self._cache_ttl_for(url))
+                    return data
                 elif response.status_code == 429:
                     wait_time = 2 ** attempt
                     print(f"[RATE_LIMIT] Waiting {wait_time}s before retry {attempt + 1}")
@@ -82,27 +194,44 @@ class CryptoAnalysisSuite:
         print("\n[ALTCOIN] FIVE-MINUTE ALTCOIN STRENGTH CHECK")
         print("=" * 50)
         
-        # Get ETH performance
-        eth_data = self.fetch_with_retries(f"{CG_BASE}/coins/ethereum", CG_HEADERS)
-        if not eth_data:
-            return {"error": "Failed to fetch ETH data"}
-        
-        eth_7d_change = eth_data.get('market_data', {}).get('price_change_percentage_7d', 0)
-        
-        # Get top gainers
-        gainers_data = self.fetch_with_retries(f"{CG_BASE}/coins/markets?vs_currency=usd&order=price_change_percentage_7d_desc&per_page=50&page=1", CG_HEADERS)
-        
+        # Get top gainers (with the 7d change field included in each row)
+        gainers_data = self.fetch_with_retries(
+            f"{CG_BASE}/coins/markets?vs_currency=usd&order=price_change_percentage_7d_desc"
+            "&per_page=50&page=1&price_change_percentage=7d",
+            CG_HEADERS
+        )
+
         if not gainers_data:
             return {"error": "Failed to fetch market data"}
-        
-        # Filter for coins beating ETH
-        eth_beaters = []
-        for coin in gainers_data:
-            if coin.get('price_change_percentage_7d', 0) > eth_7d_change and coin['id'] != 'ethereum':
-                eth_beaters.append(coin)
-        
-        # Top 5 ETH outperformers
-        top_5 = eth_beaters[:5]
+
+        # ETH performance is already present when ETH sits in the gainers
+        # response; only fall back to a dedicated one-row query when it isn't
+        eth_row = next((c for c in gainers_data if c.get('id') == 'ethereum'), None)
+        if eth_row is None:
+            eth_data = self.fetch_with_retries(
+                f"{CG_BASE}/coins/markets?vs_currency=usd&ids=ethereum&price_change_percentage=7d",
+                CG_HEADERS
+            )
+            if not eth_data:
+                return {"error": "Failed to fetch ETH data"}
+            eth_row = eth_data[0]
+
+        eth_7d_change = eth_row.get('price_change_percentage_7d_in_currency', 0) or 0
+
+        # Filter for coins beating ETH with one boolean mask, then take the
+        # top 5 outperformers in a single nlargest call
+        gainers = pd.DataFrame(gainers_data)
+        if 'price_change_percentage_7d' in gainers:
+            gainers['price_change_percentage_7d'] = gainers['price_change_percentage_7d'].fillna(0)
+        elif 'price_change_percentage_7d_in_currency' in gainers:
+            gainers['price_change_percentage_7d'] = gainers['price_change_percentage_7d_in_currency'].fillna(0)
+        else:
+            gainers['price_change_percentage_7d'] = 0.0
+        beats_eth = (
+            (gainers['price_change_percentage_7d'] > eth_7d_change)
+            & (gainers['id'] != 'ethereum')
+        )
+        top_5 = gainers[beats_eth].nlargest(5, 'price_change_percentage_7d').to_dict('records')
         
         results = {
             'eth_7d_performance': round(eth_7d_change, 2),
@@ -110,19 +239,6 @@ class CryptoAnalysisSuite:
             'analysis_time': datetime.now().isoformat()
         }
         
-        catalysts = {
-            'solana': 'Strong ecosystem growth and institutional adoption momentum',
-            'cardano': 'Recent governance upgrades and DeFi expansion',
-            'polygon': 'Layer 2 scaling solutions gaining enterprise traction', 
-            'chainlink': 'Expanding oracle partnerships with traditional finance',
-            'avalanche': 'Subnet growth and institutional blockchain adoption',
-            'polkadot': 'Parachain auctions driving ecosystem development',
-            'cosmos': 'Inter-blockchain communication protocol expansion',
-            'near': 'Developer-friendly smart contract platform growth',
-            'algorand': 'Central bank digital currency partnerships',
-            'tezos': 'NFT marketplace and institutional adoption'
-        }
-        
         for coin in top_5:
             coin_id = coin['id']
             symbol = coin['symbol'].upper()
@@ -130,7 +246,7 @@ class CryptoAnalysisSuite:
             change_7d = coin.get('price_change_percentage_7d', 0)
             
             # Get catalyst
-            catalyst = catalysts.get(coin_id, 'Strong momentum and market dynamics')
+            catalyst = CATALYSTS.get(coin_id, 'Strong momentum and market dynamics')
             
             # CoinGecko price chart link
             price_link = f"https://www.coingecko.com/en/coins/{coin_id}"
@@ -161,64 +277,78 @@ class CryptoAnalysisSuite:
         if not categories_data:
             return {"error": "Failed to fetch categories data"}
         
-        # Get DeFi TVL data for cross-validation
-        protocols_data = self.fetch_with_retries(f"{DL_BASE}/protocols", DL_HEADERS)
-        
-        # Analyze sectors
-        sector_scores = []
-        
-        for category in categories_data[:20]:  # Top 20 categories by market cap
-            if not category.get('market_cap'):
-                continue
-                
-            # Performance metrics
-            change_24h = category.get('market_cap_change_percentage_24h', 0)
-            change_7d = category.get('market_cap_change_percentage_7d', 0)  
-            change_30d = category.get('market_cap_change_percentage_30d', 0)
-            
-            # Volume/market cap ratio (turnover)
-            volume_24h = category.get('volume_24h', 0)
-            market_cap = category.get('market_cap', 1)
-            turnover_ratio = volume_24h / market_cap if market_cap > 0 else 0
-            
-            # Composite momentum score
-            momentum_score = (change_7d * 0.5 + change_30d * 0.3 + change_24h * 0.2)
-            
-            # TVL correlation (for DeFi-related sectors)
-            tvl_momentum = 0
-            if protocols_data and 'defi' in category.get('id', '').lower():
-                # Mock TVL momentum calculation
-                tvl_momentum = np.random.normal(5, 10)  # In production: calculate real TVL momentum
-            
-            # Final sector score
-            composite_score = momentum_score + (turnover_ratio * 100) + tvl_momentum
-            
-            sector_scores.append({
-                'category': category.get('name', 'Unknown'),
-                'category_id': category.get('id', ''),
-                'momentum_score': round(momentum_score, 2),
-                'turnover_ratio': round(turnover_ratio, 4),
-                'tvl_momentum': round(tvl_momentum, 2),
-                'composite_score': round(composite_score, 2),
-                'market_cap': category.get('market_cap', 0),
-                'change_7d': change_7d,
-                'change_30d': change_30d
-            })
-        
-        # Sort by composite score
-        sector_scores.sort(key=lambda x: x['composite_score'], reverse=True)
-        top_sectors = sector_scores[:5]
-        
-        # For each top sector, find best assets
+        # Analyze sectors - one column-wise pass over the top 20 categories
+        # instead of scoring dicts row by row
+        df = pd.DataFrame(categories_data[:20])
+        for col in ('market_cap_change_percentage_24h', 'market_cap_change_percentage_7d',
+                    'market_cap_change_percentage_30d', 'volume_24h'):
+            if col in df:
+                df[col] = df[col].fillna(0)
+            else:
+                df[col] = 0.0
+        df = df.dropna(subset=['market_cap'])
+        df = df[df['market_cap'] > 0]
+        if df.empty:
+            return {"error": "No categories with market cap data"}
+
+        turnover_ratio = df['volume_24h'] / df['market_cap']
+        momentum_score = (
+            df['market_cap_change_percentage_7d'] * 0.5
+            + df['market_cap_change_percentage_30d'] * 0.3
+            + df['market_cap_change_percentage_24h'] * 0.2
+        )
+
+        # TVL correlation (for DeFi-related sectors). In production this
+        # would pull per-protocol TVL series; the mock only needs the mask,
+        # so the multi-MB /protocols payload is not fetched at all
+        category_ids = df.get('id', pd.Series('', index=df.index)).fillna('')
+        is_defi = category_ids.str.lower().str.contains('defi')
+        tvl_momentum = np.where(
+            is_defi,
+            self._rng.normal(5, 10, len(df)),  # In production: calculate real TVL momentum
+            0.0
+        )
+
+        composite_score = momentum_score + (turnover_ratio * 100) + tvl_momentum
+
+        scores = pd.DataFrame({
+            'category': df.get('name', pd.Series('Unknown', index=df.index)).fillna('Unknown'),
+            'category_id': category_ids,
+            'momentum_score': momentum_score.round(2),
+            'turnover_ratio': turnover_ratio.round(4),
+            'tvl_momentum': np.round(tvl_momentum, 2),
+            'composite_score': composite_score.round(2),
+            'market_cap': df['market_cap'],
+            'change_7d': df['market_cap_change_percentage_7d'],
+            'change_30d': df['market_cap_change_percentage_30d'],
+        })
+        top_sectors = scores.nlargest(5, 'composite_score').to_dict('records')
+        
+        # For each top sector, find best assets - fetch all sector coin lists
+        # concurrently (map keeps results aligned with top_sectors order)
         sector_opportunities = []
-        
-        for sector in top_sectors:
-            # Get coins in category
-            category_coins = self.fetch_with_retries(f"{CG_BASE}/coins/markets?vs_currency=usd&category={sector['category_id']}&order=market_cap_desc&per_page=15", CG_HEADERS)
-            
+
+        with ThreadPoolExecutor(max_workers=max(len(top_sectors), 1)) as executor:
+            sector_coin_lists = list(executor.map(
+                lambda s: self.fetch_with_retries(
+                    f"{CG_BASE}/coins/markets?vs_currency=usd&category={s['category_id']}&order=market_cap_desc&per_page=15",
+                    CG_HEADERS
+                ),
+                top_sectors
+            ))
+
+        for sector, category_coins in zip(top_sectors, sector_coin_lists):
             if category_coins:
                 top_coins = []
-                for coin in category_coins[:10]:  # Top 10 by market cap
+                candidates = category_coins[:10]  # Top 10 by market cap
+                # Descending 7d-performance ranks in one argsort pass instead
+                # of re-scanning the slice for every coin
+                changes_7d = np.array(
+                    [c.get('price_change_percentage_7d', 0) or 0 for c in candidates],
+                    dtype=np.float64
+                )
+                strength_ranks = (-changes_7d).argsort().argsort() + 1
+                for i, coin in enumerate(candidates):
                     # Filter criteria
                     price_change_7d = coin.get('price_change_percentage_7d', 0)
                     volume_24h = coin.get('total_volume', 0)
@@ -241,18 +371,16 @@ class CryptoAnalysisSuite:
                             'market_cap': market_cap,
                             'entry_zone': round(entry_zone, 6),
                             'invalidation': round(invalidation, 6),
-                            'strength_rank': len([c for c in category_coins[:10] if c.get('price_change_percentage_7d', 0) > price_change_7d]) + 1
+                            'strength_rank': int(strength_ranks[i])
                         })
                 
-                # Sort by 7d performance
-                top_coins.sort(key=lambda x: x['change_7d'], reverse=True)
-                
                 sector_opportunities.append({
                     'sector': sector['category'],
                     'sector_score': sector['composite_score'],
                     'momentum': f"{sector['change_7d']:+.1f}% (7d)",
                     'thesis': self.generate_sector_thesis(sector['category']),
-                    'top_picks': top_coins[:8]  # Top 8 picks per sector
+                    # Top 8 picks by 7d performance without sorting the rest
+                    'top_picks': heapq.nlargest(8, top_coins, key=lambda x: x['change_7d'])
                 })
         
         return {
@@ -264,24 +392,7 @@ class CryptoAnalysisSuite:
 
     def generate_sector_thesis(self, sector_name: str) -> str:
         """Generate investment thesis for sector"""
-        thesis_map = {
-            'DeFi': 'Yield farming renaissance and institutional DeFi adoption',
-            'Layer 1': 'Blockchain scalability wars intensifying with new consensus mechanisms',
-            'AI': 'Artificial intelligence integration with blockchain infrastructure',
-            'Gaming': 'GameFi 2.0 with sustainable tokenomics and AAA game launches',
-            'NFT': 'Utility-focused NFTs and real-world asset tokenization',
-            'Storage': 'Decentralized storage demand from enterprise and Web3 applications',
-            'Oracle': 'Real-world data integration expanding beyond price feeds',
-            'Privacy': 'Regulatory clarity driving institutional privacy coin adoption',
-            'Metaverse': 'Virtual world infrastructure and digital real estate development',
-            'Web3': 'Decentralized internet protocols gaining mainstream adoption'
-        }
-        
-        for key, thesis in thesis_map.items():
-            if key.lower() in sector_name.lower():
-                return thesis
-        
-        return f"Strong fundamentals and momentum in {sector_name} ecosystem"
+        return _sector_thesis(sector_name)
 
     # ========================================
     # MODULE 3: TACTICAL DIP-BUYER  
@@ -296,66 +407,73 @@ class CryptoAnalysisSuite:
         target_assets = ['bitcoin', 'ethereum', 'solana', 'cardano', 'matic-network', 'chainlink', 'avalanche-2']
         
         dip_opportunities = []
-        
-        for asset_id in target_assets:
-            # Get price and volume data
-            coin_data = self.fetch_with_retries(f"{CG_BASE}/coins/{asset_id}", CG_HEADERS)
-            if not coin_data:
-                continue
-            
-            # Current metrics
-            current_price = coin_data.get('market_data', {}).get('current_price', {}).get('usd', 0)
-            change_7d = coin_data.get('market_data', {}).get('price_change_percentage_7d', 0)
-            change_30d = coin_data.get('market_data', {}).get('price_change_percentage_30d', 0)
-            
-            # Volume analysis
-            volume_24h = coin_data.get('market_data', {}).get('total_volume', {}).get('usd', 0)
-            market_cap = coin_data.get('market_data', {}).get('market_cap', {}).get('usd', 0)
-            
-            # Mock leverage reset analysis (in production: use Velo data)
-            oi_reset_magnitude = np.random.uniform(15, 45)  # % OI decline from peak
-            funding_percentile = np.random.uniform(10, 60)  # Lower = more reset
-            taker_imbalance_flip = np.random.choice([True, False], p=[0.7, 0.3])
-            
-            # Reset criteria
-            meets_oi_reset = oi_reset_magnitude > 20  # >20% OI decline
-            meets_funding_reset = funding_percentile < 50  # Below median funding
-            meets_taker_flip = taker_imbalance_flip  # Selling pressure reduced
-            
-            # Price level analysis
-            is_near_support = change_7d < -5  # >5% decline in week
-            
-            # DeFi TVL correlation (mock)
-            tvl_stability = np.random.uniform(0.8, 1.1)  # TVL holding vs price
-            
-            # Overall reset score
-            reset_conditions = [meets_oi_reset, meets_funding_reset, meets_taker_flip, is_near_support]
-            reset_score = sum(reset_conditions) / len(reset_conditions) * 100
-            
-            if reset_score >= 75:  # Strong reset signal
-                # Generate laddered entry plan
-                entry_levels = self.generate_dip_buying_plan(current_price, change_7d)
-                
+
+        # One batched /coins/markets call returns every field this analysis
+        # reads for all assets at once - no per-asset full-detail payloads
+        markets_url = (
+            f"{CG_BASE}/coins/markets?vs_currency=usd&ids={','.join(target_assets)}"
+            "&price_change_percentage=7d,30d"
+        )
+        fetched = self.fetch_with_retries(markets_url, CG_HEADERS) or []
+
+        if fetched:
+            df = pd.DataFrame(fetched)
+            for col in ('current_price', 'price_change_percentage_7d_in_currency'):
+                if col in df:
+                    df[col] = df[col].fillna(0)
+                else:
+                    df[col] = 0.0
+
+            # Mock leverage reset analysis (in production: use Velo data) -
+            # every reset criterion is a whole boolean column
+            n_assets = len(df)
+            oi_reset = self._rng.uniform(15, 45, n_assets)       # % OI decline from peak
+            funding_pct = self._rng.uniform(10, 60, n_assets)    # Lower = more reset
+            taker_flip = self._rng.random(n_assets) < 0.7        # Selling pressure reduced
+            tvl_stability = self._rng.uniform(0.8, 1.1, n_assets)  # TVL holding vs price
+
+            prices = df['current_price'].to_numpy(dtype=np.float64)
+            changes_7d = df['price_change_percentage_7d_in_currency'].to_numpy(dtype=np.float64)
+
+            # Reset criteria: >20% OI decline, below-median funding, taker
+            # flip, >5% weekly decline - scored in one stacked mean
+            flags = np.column_stack((
+                oi_reset > 20,
+                funding_pct < 50,
+                taker_flip,
+                changes_7d < -5
+            ))
+            reset_scores = flags.mean(axis=1) * 100
+
+            names = df.get('name', pd.Series('', index=df.index)).fillna('').to_numpy()
+            symbols = df.get('symbol', pd.Series('', index=df.index)).fillna('').to_numpy()
+
+            # Strong reset signals only, best first, capped at 5 - entry plans
+            # and theses are generated just for these survivors
+            winners = np.nonzero(reset_scores >= 75)[0]
+            winners = winners[np.argsort(-reset_scores[winners])][:5]
+
+            for i in winners:
+                current_price = float(prices[i])
+                change_7d = float(changes_7d[i])
+                reset_score = float(reset_scores[i])
                 dip_opportunities.append({
-                    'asset': coin_data.get('name', ''),
-                    'symbol': coin_data.get('symbol', '').upper(),
+                    'asset': names[i],
+                    'symbol': str(symbols[i]).upper(),
                     'current_price': current_price,
                     'change_7d': change_7d,
                     'reset_score': round(reset_score, 1),
-                    'oi_reset_magnitude': f"{oi_reset_magnitude:.1f}%",
-                    'funding_percentile': f"{funding_percentile:.0f}th percentile",
-                    'entry_plan': entry_levels,
-                    'tvl_stability': round(tvl_stability, 2),
+                    'oi_reset_magnitude': f"{oi_reset[i]:.1f}%",
+                    'funding_percentile': f"{funding_pct[i]:.0f}th percentile",
+                    'entry_plan': self.generate_dip_buying_plan(current_price, change_7d),
+                    'tvl_stability': round(float(tvl_stability[i]), 2),
                     'invalidation_level': current_price * 0.80,  # 20% stop loss
-                    'thesis': self.generate_dip_thesis(coin_data.get('name', ''), reset_score)
+                    'thesis': self.generate_dip_thesis(names[i], reset_score)
                 })
-        
-        # Sort by reset score
-        dip_opportunities.sort(key=lambda x: x['reset_score'], reverse=True)
-        
+
         return {
             'analysis_timeframe': f"{lookback_days} days",
-            'dip_opportunities': dip_opportunities[:5],  # Top 5 opportunities
+            'dip_opportunities': dip_opportunities,
             'market_context': self.assess_dip_buying_context(),
             'analysis_time': datetime.now().isoformat()
         }
@@ -387,12 +505,8 @@ class CryptoAnalysisSuite:
 
     def generate_dip_thesis(self, asset_name: str, reset_score: float) -> str:
         """Generate dip-buying thesis"""
-        if reset_score > 85:
-            return f"Strong leverage reset in {asset_name} with institutional accumulation zones"
-        elif reset_score > 75:
-            return f"Moderate reset conditions with {asset_name} approaching value territory"  
-        else:
-            return f"Early reset signals in {asset_name} requiring confirmation"
+        score_band = 2 if reset_score > 85 else (1 if reset_score > 75 else 0)
+        return _dip_thesis(asset_name, score_band)
 
     def assess_dip_buying_context(self) -> str:
         """Assess overall market context for dip buying"""
@@ -412,77 +526,111 @@ class CryptoAnalysisSuite:
         if not yields_data:
             return {"error": "Failed to fetch yields data"}
         
-        # Get protocol TVL data for context
-        protocols_data = self.fetch_with_retries(f"{DL_BASE}/protocols", DL_HEADERS)
-        
+        # Pre-filter on the raw pool list: one structured-array mask drops
+        # low-APY/low-TVL pools before any per-pool Python work (min 5% APY,
+        # $1M TVL), and only the first 50 qualifying pools go downstream
+        data = yields_data.get('data', [])
+        if data:
+            metrics = np.fromiter(
+                ((p.get('apy', 0) or 0, p.get('tvlUsd', 0) or 0) for p in data),
+                dtype=[('apy', 'f8'), ('tvl', 'f8')], count=len(data)
+            )
+            qualifying = np.nonzero((metrics['apy'] >= 5) & (metrics['tvl'] >= 1000000))[0][:50]
+            data = [data[i] for i in qualifying]
+
+        # Analyze top yielding opportunities - score all pools column-wise,
+        # then build detailed records only for the top_k by score
+        pools = pd.DataFrame(data)
+        for col, default in (('apy', 0.0), ('tvlUsd', 0.0), ('chain', 'Unknown'),
+                             ('project', 'Unknown'), ('symbol', 'Unknown')):
+            if col in pools:
+                pools[col] = pools[col].fillna(default)
+            else:
+                pools[col] = default
+
         yield_opportunities = []
-        
-        # Analyze top yielding opportunities
-        for pool in yields_data.get('data', [])[:50]:  # Top 50 pools by TVL
-            
-            # Basic metrics
-            apy = pool.get('apy', 0)
-            tvl = pool.get('tvlUsd', 0)
-            chain = pool.get('chain', 'Unknown')
-            project = pool.get('project', 'Unknown')
-            symbol = pool.get('symbol', 'Unknown')
-            
-            # Filter criteria
-            if apy < 5 or tvl < 1000000:  # Min 5% APY, $1M TVL
-                continue
-            
-            # Risk adjustments
-            
+        if not pools.empty:
+            n = len(pools)
+            apy = pools['apy'].to_numpy(dtype=np.float64)
+            tvl = pools['tvlUsd'].to_numpy(dtype=np.float64)
+
+            # Risk adjustments, each computed as one array op across all pools
+
             # 1. TVL momentum (mock calculation)
-            tvl_momentum = np.random.normal(0, 15)  # % change in TVL
-            tvl_weight = max(0.5, min(1.5, 1 + tvl_momentum/100))
-            
+            tvl_momentum = self._rng.normal(0, 15, n)  # % change in TVL
+            tvl_weight = np.clip(1 + tvl_momentum / 100, 0.5, 1.5)
+
             # 2. Liquidity factor (higher TVL = more liquid)
-            liquidity_factor = min(1.2, np.log10(tvl) / 6)  # Normalize by TVL size
-            
+            liquidity_factor = np.minimum(1.2, np.log10(tvl) / 6)
+
             # 3. Volatility penalty (mock - would use historical price volatility)
-            volatility_penalty = np.random.uniform(0.7, 1.0)  # Lower = more volatile
-            
+            volatility_penalty = self._rng.uniform(0.7, 1.0, n)
+
             # 4. Token concentration risk
-            concentration_risk = np.random.uniform(0.8, 1.0)  # Single token vs diversified
-            
+            concentration_risk = self._rng.uniform(0.8, 1.0, n)
+
             # 5. Protocol risk score
-            protocol_risk_score = self.assess_protocol_risk(project, chain)
-            
+            protocol_risk = self._risk_series(pools['project'], pools['chain'])
+
+            # Stress scenarios as whole columns (fused with the scoring pass);
+            # the formatted dicts are built only for the top_k survivors
+            stress_decline = np.maximum(0, apy - 5)   # 30% price decline
+            stress_exodus = np.maximum(0, apy - 8)    # 50% TVL exodus
+            stress_deval = apy * 0.6                  # Token devaluation
+            stress_worst = np.minimum(np.minimum(stress_decline, stress_exodus), stress_deval)
+
             # Sustainable Yield Score calculation
             sustainable_yield_score = (
-                apy * 
-                tvl_weight * 
-                liquidity_factor * 
-                volatility_penalty * 
-                concentration_risk *
-                protocol_risk_score
+                apy * tvl_weight * liquidity_factor
+                * volatility_penalty * concentration_risk * protocol_risk
             )
-            
-            # Stress test scenarios
-            stress_test_results = self.stress_test_yield(apy, symbol)
-            
-            yield_opportunities.append({
-                'project': project,
-                'chain': chain,
-                'symbol': symbol,
-                'base_apy': round(apy, 2),
-                'tvl_usd': tvl,
-                'sustainable_yield_score': round(sustainable_yield_score, 2),
-                'tvl_momentum': f"{tvl_momentum:+.1f}%",
-                'liquidity_factor': round(liquidity_factor, 3),
-                'volatility_penalty': round(volatility_penalty, 3),
-                'protocol_risk_score': round(protocol_risk_score, 3),
-                'stress_test': stress_test_results,
-                'red_flags': self.identify_yield_red_flags(project, apy, tvl),
-                'sizing_guidance': self.generate_sizing_guidance(sustainable_yield_score, tvl)
-            })
-        
-        # Sort by sustainable yield score
-        yield_opportunities.sort(key=lambda x: x['sustainable_yield_score'], reverse=True)
-        
+
+            projects = pools['project'].to_numpy()
+            chains = pools['chain'].to_numpy()
+            symbols = pools['symbol'].to_numpy()
+
+            # Red-flag criteria as whole boolean columns; the message lists
+            # are assembled only for the top_k survivors below
+            red_flag_matrix = np.column_stack((
+                apy > 50,
+                tvl < 5000000,
+                pools['project'].str.contains(_RED_RE, na=False).to_numpy(),
+                self._rng.random(n) < 0.3,  # Mock token concentration check
+                self._rng.random(n) < 0.2,  # Mock smart contract check
+            ))
+
+            # Round display columns once as ufuncs rather than per record
+            apy_rounded = np.round(apy, 2)
+            score_rounded = np.round(sustainable_yield_score, 2)
+            liquidity_rounded = np.round(liquidity_factor, 3)
+            volatility_rounded = np.round(volatility_penalty, 3)
+            risk_rounded = np.round(protocol_risk, 3)
+
+            for i in np.argsort(-sustainable_yield_score)[:top_k]:
+                yield_opportunities.append({
+                    'project': projects[i],
+                    'chain': chains[i],
+                    'symbol': symbols[i],
+                    'base_apy': float(apy_rounded[i]),
+                    'tvl_usd': float(tvl[i]),
+                    'sustainable_yield_score': float(score_rounded[i]),
+                    'tvl_momentum': f"{tvl_momentum[i]:+.1f}%",
+                    'liquidity_factor': float(liquidity_rounded[i]),
+                    'volatility_penalty': float(volatility_rounded[i]),
+                    'protocol_risk_score': float(risk_rounded[i]),
+                    'stress_test': {
+                        'base_scenario': f"{apy[i]:.1f}% APY",
+                        'price_decline_30%': f"{stress_decline[i]:.1f}% APY",
+                        'tvl_exodus_50%': f"{stress_exodus[i]:.1f}% APY",
+                        'token_devaluation': f"{stress_deval[i]:.1f}% APY",
+                        'worst_case': f"{stress_worst[i]:.1f}% APY"
+                    },
+                    'red_flags': [msg for flag, msg in zip(red_flag_matrix[i], _RED_FLAG_MESSAGES) if flag],
+                    'sizing_guidance': self.generate_sizing_guidance(float(sustainable_yield_score[i]), float(tvl[i]))
+                })
+
         return {
-            'top_opportunities': yield_opportunities[:top_k],
+            'top_opportunities': yield_opportunities,
             'methodology': 'Sustainable Yield Score = APY × TVL_momentum × Liquidity × (1-Volatility) × Protocol_Risk',
             'analysis_time': datetime.now().isoformat(),
             'market_context': 'DeFi yields normalizing after leverage deleveraging cycle'
@@ -490,60 +638,35 @@ class CryptoAnalysisSuite:
 
     def assess_protocol_risk(self, project: str, chain: str) -> float:
         """Assess protocol risk score (0.5 = high risk, 1.0 = low risk)"""
-        
+
         # Blue chip protocols
-        blue_chips = ['aave', 'compound', 'uniswap', 'curve', 'convex']
-        if any(chip in project.lower() for chip in blue_chips):
+        if self._bluechip_re.search(project.lower()):
             return 1.0
-        
+
         # Established chains get bonus
-        established_chains = ['ethereum', 'polygon', 'arbitrum', 'optimism']
-        chain_bonus = 0.1 if chain.lower() in established_chains else 0
-        
+        chain_bonus = 0.1 if chain.lower() in self._established_chains else 0
+
         # Base score + chain bonus
-        return min(1.0, 0.8 + chain_bonus + np.random.uniform(0, 0.1))
+        return min(1.0, 0.8 + chain_bonus + self._rng.uniform(0, 0.1))
 
-    def stress_test_yield(self, base_apy: float, symbol: str) -> Dict:
-        """Stress test yield under adverse scenarios"""
-        
-        # Scenario 1: 30% price decline
-        price_decline_30 = max(0, base_apy - 5)  # APY drops by 5% in stress
-        
-        # Scenario 2: TVL exodus (50% TVL decline)
-        tvl_exodus_apy = max(0, base_apy - 8)  # APY drops more significantly
-        
-        # Scenario 3: Token devaluation
-        token_deval_apy = base_apy * 0.6  # 40% reduction in effective yield
-        
-        return {
-            'base_scenario': f"{base_apy:.1f}% APY",
-            'price_decline_30%': f"{price_decline_30:.1f}% APY",
-            'tvl_exodus_50%': f"{tvl_exodus_apy:.1f}% APY", 
-            'token_devaluation': f"{token_deval_apy:.1f}% APY",
-            'worst_case': f"{min(price_decline_30, tvl_exodus_apy, token_deval_apy):.1f}% APY"
-        }
+    def _risk_series(self, project_s: pd.Series, chain_s: pd.Series) -> np.ndarray:
+        """Vectorized assess_protocol_risk over whole project/chain columns"""
+        is_bluechip = project_s.str.lower().str.contains(self._bluechip_re).to_numpy()
+        chain_bonus = chain_s.str.lower().isin(self._established_chains).to_numpy() * 0.1
+        base = np.minimum(1.0, 0.8 + chain_bonus + self._rng.uniform(0, 0.1, len(project_s)))
+        return np.where(is_bluechip, 1.0, base)
 
     def identify_yield_red_flags(self, project: str, apy: float, tvl: float) -> List[str]:
-        """Identify potential red flags in yield opportunities"""
-        red_flags = []
-        
-        if apy > 50:
-            red_flags.append("Unsustainably high APY - potential token emissions bubble")
-        
-        if tvl < 5000000:  # $5M
-            red_flags.append("Low TVL - liquidity and exit risk")
-        
-        if 'new' in project.lower() or 'fork' in project.lower():
-            red_flags.append("New/forked protocol - limited track record")
-        
-        # Mock additional checks
-        if np.random.random() < 0.3:
-            red_flags.append("Token concentration risk - limited diversification")
-        
-        if np.random.random() < 0.2:
-            red_flags.append("Smart contract risk - recent deployment or upgrades")
-        
-        return red_flags
+        """Scalar red-flag check (yield_pm_analysis uses the column version)"""
+        checks = (
+            apy > 50,
+            tvl < 5000000,  # $5M
+            bool(_RED_RE.search(project)),
+            # Mock additional checks
+            self._rng.random() < 0.3,
+            self._rng.random() < 0.2,
+        )
+        return [msg for flag, msg in zip(checks, _RED_FLAG_MESSAGES) if flag]
 
     def generate_sizing_guidance(self, sustainable_score: float, tvl: float) -> str:
         """Generate position sizing guidance"""
@@ -569,21 +692,18 @@ class CryptoAnalysisSuite:
         print("     SuperClaude Framework Integration")
         print("=" * 60)
         
-        # Run all analyses
-        results = {}
-        
-        # 1. Five-Minute Altcoin Check
-        results['altcoin_strength'] = self.five_minute_altcoin_check()
-        
-        # 2. Sector Scout
-        results['sector_opportunities'] = self.quant_sector_scout(timeframe_days=14)
-        
-        # 3. Dip Buyer
-        results['dip_opportunities'] = self.tactical_dip_buyer(lookback_days=14)
-        
-        # 4. Yield PM
-        results['yield_opportunities'] = self.yield_pm_analysis(top_k=8)
-        
+        # Run the four independent modules concurrently - each spends most of
+        # its time blocked on HTTP, so a small pool overlaps the waits
+        modules = {
+            'altcoin_strength': self.five_minute_altcoin_check,
+            'sector_opportunities': lambda: self.quant_sector_scout(timeframe_days=14),
+            'dip_opportunities': lambda: self.tactical_dip_buyer(lookback_days=14),
+            'yield_opportunities': lambda: self.yield_pm_analysis(top_k=8),
+        }
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = {key: pool.submit(func) for key, func in modules.items()}
+            results = {key: future.result() for key, future in futures.items()}
+
         # 5. Executive summary
         results['executive_summary'] = self.generate_executive_summary(results)
         results['analysis_timestamp'] = datetime.now().isoformat()
@@ -691,8 +811,14 @@ def main():
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     filename = f"crypto_analysis_suite_{timestamp}.json"
     
-    with open(filename, 'w') as f:
-        json.dump(full_results, f, indent=2, default=str)
+    # orjson serializes numpy scalars and datetimes natively - no
+    # default=str callback per value, and one binary write of the buffer
+    with open(filename, 'wb') as f:
+        f.write(orjson.dumps(
+            full_results,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+            default=str
+        ))
     
     print(f"\n[SAVED] Full analysis saved to: {filename}")
     
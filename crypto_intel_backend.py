@@ -5,27 +5,130 @@ Five specialized analysis modules with enterprise-grade architecture
 """
 
 import os
+import re
 import math
+import bisect
 import time
 import json
+import orjson
 import asyncio
 import logging
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from concurrent.futures import ThreadPoolExecutor
+import functools
 import threading
 
+import aiohttp
 import requests
 import numpy as np
 import pandas as pd
 from flask import Flask, request, jsonify, send_from_directory
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 from flask_caching import Cache
 import redis
 
+try:
+    import numba  # Optional - JIT-compiled beta/ATR kernels for the per-coin loop
+except ImportError:
+    numba = None
+
+try:
+    import pyarrow  # noqa: F401  Optional - Arrow-backed dtypes for markets frames
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import brotli  # noqa: F401  Optional - Brotli-compressed provider payloads
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+if numba is not None:
+    @numba.njit(cache=True, fastmath=True)
+    def _beta_capture_kernel(coin_vals, eth_vals):
+        """Beta and up/down capture over aligned float64 return arrays"""
+        n = coin_vals.shape[0]
+        sum_c = 0.0
+        sum_e = 0.0
+        for i in range(n):
+            sum_c += coin_vals[i]
+            sum_e += eth_vals[i]
+        mean_c = sum_c / n
+        mean_e = sum_e / n
+
+        cov = 0.0
+        var_e = 0.0
+        up_c = 0.0
+        up_e = 0.0
+        n_up = 0
+        down_c = 0.0
+        down_e = 0.0
+        n_down = 0
+        for i in range(n):
+            dc = coin_vals[i] - mean_c
+            de = eth_vals[i] - mean_e
+            cov += dc * de
+            var_e += de * de
+            if eth_vals[i] > 0.0:
+                up_c += coin_vals[i]
+                up_e += eth_vals[i]
+                n_up += 1
+            elif eth_vals[i] < 0.0:
+                down_c += coin_vals[i]
+                down_e += eth_vals[i]
+                n_down += 1
+
+        beta = np.nan
+        if var_e != 0.0:
+            beta = cov / var_e
+        up_capture = np.nan
+        if n_up >= 3 and up_e != 0.0:
+            up_capture = up_c / up_e
+        down_capture = np.nan
+        if n_down >= 3 and down_e != 0.0:
+            down_capture = abs(down_c) / abs(down_e)
+        return beta, up_capture, down_capture
+
+    @numba.njit(cache=True, fastmath=True)
+    def _atr_kernel(window):
+        """Mean absolute one-step return over a trailing price window"""
+        total = 0.0
+        for i in range(1, window.shape[0]):
+            total += abs((window[i] - window[i - 1]) / window[i - 1])
+        return total / (window.shape[0] - 1)
+else:
+    def _beta_capture_kernel(coin_vals, eth_vals):
+        """NumPy fallback when numba is not installed"""
+        var_e = eth_vals.var()
+        if var_e != 0:
+            beta = ((coin_vals - coin_vals.mean()) * (eth_vals - eth_vals.mean())).mean() / var_e
+        else:
+            beta = float('nan')
+
+        up = eth_vals > 0
+        down = eth_vals < 0
+        up_capture = float('nan')
+        down_capture = float('nan')
+        if up.sum() >= 3:
+            eth_up_mean = eth_vals[up].mean()
+            if eth_up_mean != 0:
+                up_capture = coin_vals[up].mean() / eth_up_mean
+        if down.sum() >= 3:
+            eth_down_mean = eth_vals[down].mean()
+            if eth_down_mean != 0:
+                down_capture = abs(coin_vals[down].mean()) / abs(eth_down_mean)
+        return beta, up_capture, down_capture
+
+    def _atr_kernel(window):
+        """NumPy fallback when numba is not installed"""
+        return float(np.abs(np.diff(window) / window[:-1]).mean())
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -59,6 +162,21 @@ HEADERS_VELO = {
     "Authorization": f"Bearer {VELO_KEY}"
 }
 
+# Growth-catalyst keywords for the screener's news scan; the compiled
+# alternation finds the first hit in one pass over each article instead
+# of one substring test per keyword
+NEWS_KEYWORDS = {
+    'airdrop': 'Airdrop/points season attracting liquidity',
+    'incentive': 'Incentive program driving TVL growth',
+    'launch': 'New feature launch catalyzing growth',
+    'partnership': 'Strategic partnership announcement'
+}
+_NEWS_RE = re.compile('|'.join(re.escape(k) for k in NEWS_KEYWORDS))
+
+# Positive-catalyst headline check for the deep dive - one case-insensitive
+# pass instead of four substring probes over a lowercased copy per article
+_IMPACT_RE = re.compile('launch|partnership|listing|upgrade', re.IGNORECASE)
+
 # Stablecoin identifiers to exclude
 STABLE_IDS = {
     "tether", "usd-coin", "first-digital-usd", "binance-usd", "dai", "frax", 
@@ -66,11 +184,60 @@ STABLE_IDS = {
     "usdy", "susd", "lusd", "fdusd", "pyusd", "usde"
 }
 
+# Activity tiers for the micro-cap report: one binary search into the
+# label table instead of an if/elif ladder (bisect_left keeps the strict
+# greater-than boundary semantics of the old branches)
+_ACTIVITY_THRESHOLDS = (0.05, 0.1, 0.5)
+_ACTIVITY_LABELS = ('Low', 'Moderate', 'High', 'Extremely High')
+
+# Static report boilerplate hoisted out of the handlers - the same
+# tuples serialize on every response without per-request list allocation
+_MICROCAP_RISKS = (
+    'Extreme volatility due to small market cap',
+    'Limited liquidity for large position sizes',
+    'Higher susceptibility to market manipulation',
+    'Potential for significant price swings'
+)
+_DD_STRENGTHS = (
+    'Established market presence',
+    'Active trading volume',
+    'Available on major exchanges'
+)
+_DD_RISKS = (
+    'Market volatility exposure',
+    'Regulatory uncertainty',
+    'Competition from similar projects'
+)
+_MODULES = (
+    'Altcoin Outperformers',
+    'High Beta Analysis',
+    'DeFiLlama Screener',
+    'Micro-Cap Report',
+    'Deep Dive Analysis'
+)
+
+# Exclusion sets precomputed once - the per-request set unions are gone
+# from the handlers
+EXCLUDED_IDS = frozenset(STABLE_IDS | {'bitcoin', 'ethereum', 'wrapped-bitcoin', 'binancecoin', 'ripple'})
+MICROCAP_EXCLUDED_IDS = frozenset(STABLE_IDS | {'bitcoin', 'ethereum', 'wrapped-bitcoin'})
+
 # ============================================================================
 # FLASK APPLICATION SETUP
 # ============================================================================
 
+class ORJSONProvider(DefaultJSONProvider):
+    """Serialize jsonify() payloads with orjson instead of stdlib json"""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(
+            obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        ).decode()
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 CORS(app)
 
 # Rate limiting
@@ -95,6 +262,54 @@ except Exception:
 # Thread pool for concurrent operations
 executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="crypto-intel")
 
+def swr_cached(fresh: int, stale: int):
+    """Stale-while-revalidate cache for zero-argument route handlers.
+
+    Fresh hits return the stored response directly. Once fresh expires,
+    the stale response is still served immediately while a single
+    background refresh rebuilds it - no request eats the full upstream
+    latency at the cache boundary the way plain @cache.cached expiry does.
+    """
+    def decorator(func):
+        key = f"swr:{func.__name__}"
+        state_lock = threading.Lock()
+        state = {'refreshing': False}
+
+        def compute_and_store():
+            value = func()
+            # Error tuples pass through uncached so a failed upstream
+            # fetch is not pinned for the whole stale window
+            if not isinstance(value, tuple):
+                cache.set(key, (value, time.time() + fresh), timeout=stale)
+            return value
+
+        def background_refresh():
+            try:
+                with app.app_context():
+                    compute_and_store()
+            except Exception as e:
+                logger.warning(f"Background refresh of {func.__name__} failed: {e}")
+            finally:
+                with state_lock:
+                    state['refreshing'] = False
+
+        @functools.wraps(func)
+        def wrapper():
+            entry = cache.get(key)
+            if entry is not None:
+                value, fresh_until = entry
+                if time.time() >= fresh_until:
+                    with state_lock:
+                        should_refresh = not state['refreshing']
+                        if should_refresh:
+                            state['refreshing'] = True
+                    if should_refresh:
+                        executor.submit(background_refresh)
+                return value
+            return compute_and_store()
+        return wrapper
+    return decorator
+
 # ============================================================================
 # DATA CLASSES
 # ============================================================================
@@ -133,6 +348,16 @@ class ResilientHTTPClient:
     def __init__(self):
         self.session = requests.Session()
         self.session.headers.update({'User-Agent': 'GPT5-Crypto-Intelligence/1.0'})
+        # The stock adapter keeps only 10 pooled connections; with 8
+        # executor threads hammering the same hosts that means blocking on
+        # the pool and extra TCP/TLS handshakes. Size it for the fan-outs.
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=64)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        # Only advertise Brotli when we can actually decode it; gzip stays
+        # the fallback either way
+        if BROTLI_AVAILABLE:
+            self.session.headers['Accept-Encoding'] = 'gzip, br'
     
     def get(self, url: str, params: Dict = None, headers: Dict = None, 
             retries: int = 3, backoff: float = 1.5) -> Any:
@@ -157,7 +382,7 @@ class ResilientHTTPClient:
                 response.raise_for_status()
                 
                 if 'application/json' in response.headers.get('Content-Type', ''):
-                    return response.json()
+                    return orjson.loads(response.content)
                 return response.text
                 
             except Exception as e:
@@ -181,59 +406,75 @@ def calculate_pct_change(new_val: float, old_val: float) -> float:
         return float('nan')
     return ((new_val / old_val) - 1.0) * 100.0
 
+def markets_to_frame(markets: List[Dict]) -> pd.DataFrame:
+    """Markets payload as a DataFrame, Arrow-backed when pyarrow is present.
+
+    Arrow strings keep id/name/symbol out of object dtype (no Python
+    object per cell) and run isin/string kernels in C++.
+    """
+    df = pd.DataFrame(markets)
+    if PYARROW_AVAILABLE:
+        df = df.convert_dtypes(dtype_backend='pyarrow')
+    return df
+
 def market_chart_to_series(chart: Dict) -> pd.Series:
     """Convert CoinGecko market chart to pandas Series"""
     prices = chart.get('prices', [])
     if not prices:
         return pd.Series(dtype=float)
     
-    dates = [pd.Timestamp(x[0], unit='ms', tz='UTC').date() for x in prices]
-    values = [x[1] for x in prices]
-    
-    series = pd.Series(values, index=pd.DatetimeIndex(dates), dtype=float)
+    # One C-level conversion instead of a Timestamp per row; normalize()
+    # plays the role of the old per-element .date() call
+    arr = np.asarray(prices, dtype=np.float64)
+    timestamps = pd.to_datetime(arr[:, 0], unit='ms', utc=True).normalize()
+
+    series = pd.Series(arr[:, 1], index=timestamps)
     return series[~series.index.duplicated(keep='last')].sort_index()
 
-def compute_beta_metrics(coin_returns: pd.Series, eth_returns: pd.Series) -> Dict:
-    """Calculate beta and up/down capture ratios"""
-    df = pd.concat([coin_returns, eth_returns], axis=1, join='inner').dropna()
-    df.columns = ['coin', 'eth']
-    
-    if len(df) < 10:
+def series_to_returns_np(series: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """Daily returns of a price series as (dates, values) plain arrays"""
+    returns = series.pct_change().dropna()
+    return (returns.index.values.astype('datetime64[D]'),
+            returns.to_numpy(dtype=np.float64))
+
+def compute_beta_metrics(coin_dates: np.ndarray, coin_values: np.ndarray,
+                         eth_dates: np.ndarray, eth_values: np.ndarray) -> Dict:
+    """Calculate beta and up/down capture ratios from date/value arrays"""
+    # Align on dates once with intersect1d, then work on raw float64
+    # arrays - no intermediate Series, DataFrame, or index objects per coin
+    _, coin_idx, eth_idx = np.intersect1d(
+        coin_dates, eth_dates, assume_unique=True, return_indices=True
+    )
+    coin_vals = coin_values[coin_idx]
+    eth_vals = eth_values[eth_idx]
+    valid = ~(np.isnan(coin_vals) | np.isnan(eth_vals))
+    coin_vals = coin_vals[valid]
+    eth_vals = eth_vals[valid]
+
+    if coin_vals.size < 10:
         return {
             'beta': float('nan'),
-            'up_capture': float('nan'), 
+            'up_capture': float('nan'),
             'down_capture': float('nan')
         }
-    
-    # Calculate beta (covariance / variance)
-    cov_matrix = np.cov(df['coin'], df['eth'])
-    beta = cov_matrix[0, 1] / np.var(df['eth']) if np.var(df['eth']) != 0 else float('nan')
-    
-    # Up/down capture ratios
-    up_days = df[df['eth'] > 0]
-    down_days = df[df['eth'] < 0]
-    
-    up_capture = float('nan')
-    down_capture = float('nan')
-    
-    if len(up_days) >= 3 and up_days['eth'].mean() != 0:
-        up_capture = up_days['coin'].mean() / up_days['eth'].mean()
-    
-    if len(down_days) >= 3 and down_days['eth'].mean() != 0:
-        down_capture = abs(down_days['coin'].mean()) / abs(down_days['eth'].mean())
-    
+
+    beta, up_capture, down_capture = _beta_capture_kernel(coin_vals, eth_vals)
+
     return {
-        'beta': beta,
-        'up_capture': up_capture,
-        'down_capture': down_capture
+        'beta': float(beta),
+        'up_capture': float(up_capture),
+        'down_capture': float(down_capture)
     }
 
 def calculate_atr_percentage(price_series: pd.Series, period: int = 14) -> float:
     """Calculate ATR as percentage of price"""
-    returns = price_series.pct_change().abs()
-    if len(returns) < period + 1:
+    # Slice the trailing window first and hand it to the compiled kernel -
+    # no intermediate Series from pct_change/abs/tail per call
+    values = price_series.to_numpy(dtype=np.float64)
+    if values.size < period + 1:
         return float('nan')
-    return returns.tail(period).mean()
+    window = np.ascontiguousarray(values[-(period + 1):])
+    return float(_atr_kernel(window))
 
 # ============================================================================
 # API DATA PROVIDERS
@@ -241,34 +482,117 @@ def calculate_atr_percentage(price_series: pd.Series, period: int = 14) -> float
 
 class CoinGeckoProvider:
     @staticmethod
+    @cache.memoize(timeout=300)
     def get_markets(page: int = 1, per_page: int = 250) -> List[Dict]:
-        """Fetch coin markets data"""
+        """Fetch coin markets data (cached per page/per_page across routes)"""
         params = {
             'vs_currency': 'usd',
             'order': 'market_cap_desc',
             'per_page': per_page,
             'page': page,
             'sparkline': 'false',
-            'price_change_percentage': '30d',
-            'x_cg_pro_api_key': CG_KEY
+            'price_change_percentage': '30d'
         }
         return http_client.get(f"{CG_BASE}/coins/markets", params=params, headers=HEADERS_CG)
     
     @staticmethod
+    @cache.memoize(timeout=60)
+    def get_market_by_id(coin_id: str, price_change_percentage: str = '24h,7d,30d') -> Optional[Dict]:
+        """Fetch one coin's market row via the batched ids= endpoint.
+
+        A single small row instead of re-pulling and scanning a 250-row
+        page when only one coin's fresh numbers are needed.
+        """
+        params = {
+            'vs_currency': 'usd',
+            'ids': coin_id,
+            'sparkline': 'false',
+            'price_change_percentage': price_change_percentage
+        }
+        rows = http_client.get(f"{CG_BASE}/coins/markets", params=params, headers=HEADERS_CG)
+        return rows[0] if rows else None
+
+    @staticmethod
+    @cache.memoize(timeout=300)
     def get_market_chart(coin_id: str, days: int = 90) -> Dict:
-        """Fetch market chart data"""
+        """Fetch market chart data (cached per coin/days across routes)"""
         params = {
             'vs_currency': 'usd',
             'days': str(days),
-            'interval': 'daily',
-            'x_cg_pro_api_key': CG_KEY
+            'interval': 'daily'
         }
         return http_client.get(f"{CG_BASE}/coins/{coin_id}/market_chart", params=params, headers=HEADERS_CG)
 
+@cache.memoize(timeout=300)
+def get_all_markets(pages: int = 4) -> List[Dict]:
+    """Merged top-1000 market snapshot, fetched concurrently, cached once.
+
+    Every consumer shares this one snapshot instead of re-pulling the
+    same upstream pages under its own route cache key.
+    """
+    markets = []
+    for page_data in executor.map(
+            lambda page: CoinGeckoProvider.get_markets(page=page, per_page=250),
+            range(1, pages + 1)):
+        markets.extend(page_data)
+    return markets
+
+@cache.memoize(timeout=300)
+def get_symbol_index() -> Dict[str, Dict]:
+    """Ticker symbol -> market row for the top 1000 coins.
+
+    One hash probe replaces the linear scan of a 250-row page (which
+    also silently 404'd any coin ranked below 250). Symbol collisions
+    keep the higher-market-cap coin: rows are written in ascending cap
+    order so the bigger one lands last.
+    """
+    markets = sorted(get_all_markets(), key=lambda c: c.get('market_cap') or 0)
+    return {c['symbol'].upper(): c for c in markets}
+
+@cache.memoize(timeout=600)
+def get_eth_returns_np() -> Tuple[np.ndarray, np.ndarray]:
+    """ETH daily returns as plain (dates, values) arrays.
+
+    Cached so the benchmark is computed once per TTL rather than per
+    request, and stored as arrays so per-coin consumers never rebuild a
+    pandas object from it.
+    """
+    eth_chart = CoinGeckoProvider.get_market_chart('ethereum', days=90)
+    return series_to_returns_np(market_chart_to_series(eth_chart))
+
+async def fetch_market_charts(coin_ids: List[str], days: int = 90,
+                              max_concurrent: int = 16) -> List[Optional[Dict]]:
+    """Fetch many market charts concurrently on one event loop.
+
+    Auth travels in the header only (no x_cg_pro_api_key query param) so
+    the CDN can cache the canonical URL. Failed fetches come back as None
+    in their original position.
+    """
+    params = {'vs_currency': 'usd', 'days': str(days), 'interval': 'daily'}
+    semaphore = asyncio.Semaphore(max_concurrent)
+    connector = aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+    timeout = aiohttp.ClientTimeout(total=30)
+
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                     headers=HEADERS_CG) as session:
+        async def fetch_chart(coin_id: str) -> Optional[Dict]:
+            async with semaphore:
+                try:
+                    async with session.get(f"{CG_BASE}/coins/{coin_id}/market_chart",
+                                           params=params) as response:
+                        response.raise_for_status()
+                        return await response.json()
+                except Exception as e:
+                    logger.warning(f"Chart fetch failed for {coin_id}: {e}")
+                    return None
+
+        return list(await asyncio.gather(*(fetch_chart(cid) for cid in coin_ids)))
+
 class DeFiLlamaProvider:
     @staticmethod
+    @cache.memoize(timeout=86400)
     def get_protocols() -> List[Dict]:
-        """Fetch all DeFi protocols"""
+        """Fetch all DeFi protocols (slow-moving; cached for a day)"""
         return http_client.get(f"{LLAMA_BASE}/protocols", headers=HEADERS_LLAMA)
     
     @staticmethod
@@ -276,6 +600,25 @@ class DeFiLlamaProvider:
         """Fetch specific protocol data"""
         return http_client.get(f"{LLAMA_BASE}/protocol/{slug}", headers=HEADERS_LLAMA)
 
+@cache.memoize(timeout=900)
+def get_protocols_compact() -> bytes:
+    """Pre-filtered protocol list as a compact orjson blob.
+
+    Only the fields the screener reads survive, and the FDV < $100M cut
+    is applied before caching - a warm hit deserializes a small bytes
+    payload instead of unpickling the raw /protocols response.
+    """
+    return orjson.dumps([
+        {
+            'slug': p.get('slug'),
+            'name': p.get('name'),
+            'fdv': p.get('fdv'),
+            'chains': p.get('chains', [])
+        }
+        for p in DeFiLlamaProvider.get_protocols()
+        if p.get('fdv') and p['fdv'] < 100_000_000
+    ])
+
 class VeloProvider:
     @staticmethod
     def search_news(entity: str, days: int = 14, limit: int = 5) -> List[Dict]:
@@ -303,7 +646,7 @@ class VeloProvider:
 
 @app.route('/api/altcoin-outperformers')
 @limiter.limit("30 per minute")
-@cache.cached(timeout=600)  # Longer cache for better performance
+@swr_cached(fresh=300, stale=1800)  # Serve stale while a background refresh runs
 def altcoin_outperformers():
     """Find altcoins that beat ETH's 30-day return using CoinGecko Pro API only"""
     try:
@@ -311,74 +654,68 @@ def altcoin_outperformers():
         logger.info("Fetching market data from CoinGecko Pro API...")
         markets = CoinGeckoProvider.get_markets(page=1, per_page=100)  # Reduced to top 100 for speed
         
-        # Find ETH performance quickly
-        eth_data = next((coin for coin in markets if coin['id'] == 'ethereum'), None)
-        if not eth_data:
+        # One DataFrame pass replaces the per-coin Python loop: the
+        # filter, the vs-ETH margin, and the catalyst tiering are all
+        # C-level column operations
+        df = markets_to_frame(markets)
+        eth_rows = df[df['id'] == 'ethereum']
+        if eth_rows.empty:
             return jsonify({'error': 'ETH data not found'}), 500
-            
-        eth_30d_return = eth_data.get('price_change_percentage_30d_in_currency', 0)
+
+        eth_30d_return = float(eth_rows['price_change_percentage_30d_in_currency'].fillna(0).iat[0])
+        eth_price = float(eth_rows['current_price'].fillna(0).iat[0])
         logger.info(f"ETH 30d return: {eth_30d_return:.2f}%")
-        
-        # Pre-filter and process efficiently
-        outperformers = []
-        excluded_ids = STABLE_IDS | {'bitcoin', 'ethereum', 'wrapped-bitcoin', 'binancecoin', 'ripple'}
-        
-        for coin in markets:
-            # Skip excluded coins
-            if coin['id'] in excluded_ids:
-                continue
-                
-            coin_30d = coin.get('price_change_percentage_30d_in_currency')
-            if coin_30d is None or coin_30d <= eth_30d_return:
-                continue
-            
-            # Only include coins with reasonable market cap (> $10M)    
-            market_cap = coin.get('market_cap', 0)
-            if market_cap < 10_000_000:
-                continue
-                
-            # Generate catalyst based on performance level
-            vs_eth_pp = coin_30d - eth_30d_return
-            if vs_eth_pp > 100:
-                catalyst = "Exceptional breakout momentum - potential paradigm shift"
-            elif vs_eth_pp > 50:
-                catalyst = "Strong outperformance vs ETH - major catalyst likely"  
-            elif vs_eth_pp > 20:
-                catalyst = "Solid outperformance - positive developments driving price"
-            else:
-                catalyst = "Moderate outperformance vs Ethereum benchmark"
-            
-            outperformers.append({
+
+        pct_30d = df['price_change_percentage_30d_in_currency']
+        qualified = df[
+            ~df['id'].isin(EXCLUDED_IDS)
+            & pct_30d.notna()
+            & (pct_30d > eth_30d_return)
+            & (df['market_cap'].fillna(0) >= 10_000_000)  # Reasonable market cap only
+        ].copy()
+
+        qualified['vs_eth_pp'] = qualified['price_change_percentage_30d_in_currency'] - eth_30d_return
+        vs_eth = qualified['vs_eth_pp'].to_numpy(dtype=np.float64)
+        qualified['catalyst'] = np.select(
+            [vs_eth > 100, vs_eth > 50, vs_eth > 20],
+            [
+                "Exceptional breakout momentum - potential paradigm shift",
+                "Strong outperformance vs ETH - major catalyst likely",
+                "Solid outperformance - positive developments driving price",
+            ],
+            default="Moderate outperformance vs Ethereum benchmark"
+        )
+
+        top_5 = [
+            {
                 'id': coin['id'],
                 'name': coin['name'],
                 'symbol': coin['symbol'].upper(),
                 'current_price': coin['current_price'],
-                'market_cap': market_cap,
-                'volume_24h': coin.get('total_volume', 0),
-                'return_30d': round(coin_30d, 2),
-                'vs_eth_pp': round(vs_eth_pp, 2),
-                'catalyst': catalyst,
-                'rank': coin.get('market_cap_rank', 999),
+                'market_cap': coin['market_cap'],
+                'volume_24h': coin.get('total_volume', 0) or 0,
+                'return_30d': round(coin['price_change_percentage_30d_in_currency'], 2),
+                'vs_eth_pp': round(coin['vs_eth_pp'], 2),
+                'catalyst': coin['catalyst'],
+                'rank': coin.get('market_cap_rank') or 999,
                 'coingecko_link': f"https://www.coingecko.com/en/coins/{coin['id']}"
-            })
-        
-        # Sort by outperformance margin and take top 5
-        outperformers.sort(key=lambda x: x['vs_eth_pp'], reverse=True)
-        top_5 = outperformers[:5]
-        
-        logger.info(f"Found {len(outperformers)} outperformers, returning top 5")
+            }
+            for coin in qualified.nlargest(5, 'vs_eth_pp').to_dict('records')
+        ]
+
+        logger.info(f"Found {len(qualified)} outperformers, returning top 5")
         
         return jsonify({
             'status': 'success',
             'eth_benchmark': {
                 'return_30d': round(eth_30d_return, 2),
                 'name': 'Ethereum',
-                'current_price': eth_data.get('current_price', 0)
+                'current_price': eth_price
             },
             'outperformers': top_5,
             'analysis_time': datetime.utcnow().isoformat(),
             'total_analyzed': len(markets),
-            'qualified_count': len(outperformers),
+            'qualified_count': len(qualified),
             'methodology': 'CoinGecko Pro API - Top 100 coins by market cap, excluding stablecoins',
             'filters_applied': [
                 'Market cap > $10M',
@@ -404,69 +741,114 @@ def high_beta_analysis():
         # Fetch market data
         markets = CoinGeckoProvider.get_markets(per_page=250)
         
-        # Get ETH price history
-        eth_chart = CoinGeckoProvider.get_market_chart('ethereum', days=90)
-        eth_series = market_chart_to_series(eth_chart)
-        eth_returns = eth_series.pct_change().dropna()
+        # Get ETH benchmark returns (cached as plain arrays)
+        eth_dates, eth_values = get_eth_returns_np()
         
-        high_beta_coins = []
-        
-        # Analyze each coin concurrently
-        def analyze_coin(coin):
+        # Overlap the ~100 chart fetches on one event loop instead of
+        # eight pooled threads, then run the cheap math synchronously
+        candidates = [
+            coin for coin in markets[:100]  # Limit to top 100 for performance
+            if coin['id'] not in STABLE_IDS and coin['id'] not in {'bitcoin', 'ethereum'}
+        ]
+        charts = asyncio.run(fetch_market_charts([c['id'] for c in candidates], days=90))
+
+        # Stack every coin's returns into one T-by-benchmark matrix (NaN
+        # where a coin has no observation for a benchmark day) so betas
+        # and capture ratios come out of a handful of matrix reductions
+        # instead of 100 per-coin passes
+        kept_coins = []
+        return_rows = []
+        atr_values = []
+        last_prices = []
+        n_days = eth_values.shape[0]
+
+        for coin, chart in zip(candidates, charts):
             try:
-                if coin['id'] in STABLE_IDS or coin['id'] in {'bitcoin', 'ethereum'}:
-                    return None
-                
-                chart = CoinGeckoProvider.get_market_chart(coin['id'], days=90)
+                if not chart:
+                    continue
+
                 series = market_chart_to_series(chart)
-                
                 if len(series) < 30:
-                    return None
-                
-                returns = series.pct_change().dropna()
-                metrics = compute_beta_metrics(returns, eth_returns)
-                
-                if (metrics['beta'] > 1.2 and 
-                    metrics['up_capture'] > 1.0 and 
-                    metrics['down_capture'] > 1.0):
-                    
-                    atr_pct = calculate_atr_percentage(series)
-                    if not math.isnan(atr_pct):
-                        buy_blood_level = series.iloc[-1] * (1 - 2.5 * atr_pct)
-                        
-                        return {
-                            'id': coin['id'],
-                            'name': coin['name'],
-                            'symbol': coin['symbol'].upper(),
-                            'current_price': coin['current_price'],
-                            'market_cap': coin['market_cap'],
-                            'beta': round(metrics['beta'], 2),
-                            'up_capture': round(metrics['up_capture'], 2),
-                            'down_capture': round(metrics['down_capture'], 2),
-                            'buy_blood_level': round(buy_blood_level, 6),
-                            'atr_percentage': round(atr_pct * 100, 2),
-                            'coingecko_link': f"https://www.coingecko.com/en/coins/{coin['id']}"
-                        }
-                        
+                    continue
+
+                atr_pct = calculate_atr_percentage(series)
+                if math.isnan(atr_pct):
+                    continue
+
+                coin_dates, coin_values = series_to_returns_np(series)
+                row = np.full(n_days, np.nan)
+                _, coin_idx, eth_idx = np.intersect1d(
+                    coin_dates, eth_dates, assume_unique=True, return_indices=True
+                )
+                row[eth_idx] = coin_values[coin_idx]
+                if np.isfinite(row).sum() < 10:
+                    continue
+
+                kept_coins.append(coin)
+                return_rows.append(row)
+                atr_values.append(atr_pct)
+                last_prices.append(float(series.iloc[-1]))
+
             except Exception as e:
                 logger.warning(f"Failed to analyze {coin.get('name', 'unknown')}: {e}")
-                return None
-        
-        # Process coins concurrently
-        futures = []
-        for coin in markets[:100]:  # Limit to top 100 for performance
-            future = executor.submit(analyze_coin, coin)
-            futures.append(future)
-        
-        # Collect results
-        for future in futures:
-            try:
-                result = future.result(timeout=30)
-                if result:
-                    high_beta_coins.append(result)
-            except Exception as e:
-                logger.warning(f"Future failed: {e}")
-        
+
+        high_beta_coins = []
+        if kept_coins:
+            returns_matrix = np.vstack(return_rows)
+            valid = np.isfinite(returns_matrix)
+            counts = valid.sum(axis=1)
+            coin_zeroed = np.where(valid, returns_matrix, 0.0)
+
+            # Per-coin means over each coin's own valid benchmark days
+            mean_coin = coin_zeroed.sum(axis=1) / counts
+            mean_eth = (valid * eth_values).sum(axis=1) / counts
+
+            delta_coin = np.where(valid, returns_matrix - mean_coin[:, None], 0.0)
+            delta_eth = np.where(valid, eth_values[None, :] - mean_eth[:, None], 0.0)
+            cov = (delta_coin * delta_eth).sum(axis=1) / counts
+            var_eth = (delta_eth * delta_eth).sum(axis=1) / counts
+            betas = cov / np.where(var_eth == 0.0, np.nan, var_eth)
+
+            up_valid = valid & (eth_values > 0)[None, :]
+            down_valid = valid & (eth_values < 0)[None, :]
+            up_coin = np.where(up_valid, returns_matrix, 0.0).sum(axis=1)
+            up_eth = (up_valid * eth_values).sum(axis=1)
+            down_coin = np.where(down_valid, returns_matrix, 0.0).sum(axis=1)
+            down_eth = (down_valid * eth_values).sum(axis=1)
+
+            up_capture = np.where(
+                up_valid.sum(axis=1) >= 3,
+                up_coin / np.where(up_eth == 0.0, np.nan, up_eth),
+                np.nan
+            )
+            down_capture = np.where(
+                down_valid.sum(axis=1) >= 3,
+                np.abs(down_coin) / np.where(down_eth == 0.0, np.nan, np.abs(down_eth)),
+                np.nan
+            )
+
+            qualifies = np.nonzero(
+                (betas > 1.2) & (up_capture > 1.0) & (down_capture > 1.0)
+            )[0]
+
+            for i in qualifies:
+                coin = kept_coins[i]
+                atr_pct = atr_values[i]
+                buy_blood_level = last_prices[i] * (1 - 2.5 * atr_pct)
+                high_beta_coins.append({
+                    'id': coin['id'],
+                    'name': coin['name'],
+                    'symbol': coin['symbol'].upper(),
+                    'current_price': coin['current_price'],
+                    'market_cap': coin['market_cap'],
+                    'beta': round(float(betas[i]), 2),
+                    'up_capture': round(float(up_capture[i]), 2),
+                    'down_capture': round(float(down_capture[i]), 2),
+                    'buy_blood_level': round(buy_blood_level, 6),
+                    'atr_percentage': round(atr_pct * 100, 2),
+                    'coingecko_link': f"https://www.coingecko.com/en/coins/{coin['id']}"
+                })
+
         # Sort by beta and take top 5
         high_beta_coins.sort(key=lambda x: x['beta'], reverse=True)
         
@@ -493,7 +875,7 @@ def high_beta_analysis():
 def defillama_screener():
     """Screen DeFi protocols: FDV < $100M, TVL growth > 30%, FDV/TVL < 1"""
     try:
-        protocols = DeFiLlamaProvider.get_protocols()
+        protocols = orjson.loads(get_protocols_compact())
         qualified_protocols = []
         
         def analyze_protocol(protocol):
@@ -502,10 +884,10 @@ def defillama_screener():
                 if not slug:
                     return None
                 
-                fdv = protocol.get('fdv')
-                if not fdv or fdv >= 100_000_000:  # FDV must be < $100M
-                    return None
-                
+                # FDV < $100M is guaranteed upstream by get_protocols_compact,
+                # so every worker that runs earns its /protocol/{slug} call
+                fdv = protocol['fdv']
+
                 # Get detailed protocol data for TVL analysis
                 detail = DeFiLlamaProvider.get_protocol(slug)
                 tvl_data = detail.get('tvl', [])
@@ -536,19 +918,12 @@ def defillama_screener():
                 reason = "TVL accelerating and FDV/TVL < 1; likely undervalued"
                 try:
                     news = VeloProvider.search_news(protocol.get('name', slug), days=14, limit=3)
-                    if news:
-                        keywords = {
-                            'airdrop': 'Airdrop/points season attracting liquidity',
-                            'incentive': 'Incentive program driving TVL growth',
-                            'launch': 'New feature launch catalyzing growth',
-                            'partnership': 'Strategic partnership announcement'
-                        }
-                        for article in news:
-                            text = (article.get('title', '') + ' ' + article.get('summary', '')).lower()
-                            for keyword, explanation in keywords.items():
-                                if keyword in text:
-                                    reason = explanation
-                                    break
+                    for article in news or []:
+                        text = (article.get('title', '') + ' ' + article.get('summary', '')).lower()
+                        match = _NEWS_RE.search(text)
+                        if match:
+                            reason = NEWS_KEYWORDS[match.group(0)]
+                            break
                 except Exception:
                     pass
                 
@@ -568,11 +943,13 @@ def defillama_screener():
                 logger.warning(f"Failed to analyze protocol {protocol.get('name', 'unknown')}: {e}")
                 return None
         
-        # Process protocols concurrently
-        futures = []
-        for protocol in protocols[:500]:  # Limit for performance
-            future = executor.submit(analyze_protocol, protocol)
-            futures.append(future)
+        # Process only FDV-qualified candidates concurrently - the filter
+        # already ran upstream, so no worker burns an HTTP call on a
+        # protocol that was never going to pass
+        futures = [
+            executor.submit(analyze_protocol, protocol)
+            for protocol in protocols[:500]  # Limit for performance
+        ]
         
         # Collect results
         for future in futures:
@@ -608,60 +985,44 @@ def defillama_screener():
 
 @app.route('/api/microcap-report')
 @limiter.limit("10 per minute")
-@cache.cached(timeout=900)  # Shorter cache for more dynamic data
+@swr_cached(fresh=300, stale=1800)  # Price-bearing: refresh on price cadence, serve stale meanwhile
 def microcap_report():
     """Select micro-cap (<$50M) with strong fundamentals using CoinGecko Pro API"""
     try:
         logger.info("Fetching market data for micro-cap analysis...")
         
-        # Fetch more pages to find micro-caps (they're typically lower ranked)
-        markets = []
-        for page in range(1, 4):  # Fetch top 1000 coins to find micro-caps
-            page_data = CoinGeckoProvider.get_markets(page=page, per_page=250)
-            markets.extend(page_data)
-            time.sleep(0.05)  # Reduced sleep for Pro API
+        # Micro-caps are typically lower ranked - read the shared top-1000
+        # snapshot rather than fetching private copies of the same pages
+        markets = get_all_markets()
         
         # Filter micro-caps with improved criteria
-        excluded_ids = STABLE_IDS | {'bitcoin', 'ethereum', 'wrapped-bitcoin'}
         
-        microcaps = []
-        for coin in markets:
-            market_cap = coin.get('market_cap')
-            if not market_cap:
-                continue
-                
-            # Increased threshold to $50M and added minimum of $1M
-            if not (1_000_000 < market_cap < 50_000_000):
-                continue
-                
-            # Skip excluded coins
-            if coin['id'] in excluded_ids:
-                continue
-                
-            # Must have reasonable volume (market cap to volume ratio)
-            volume_24h = coin.get('total_volume', 0)
-            if volume_24h < 10_000:  # At least $10K daily volume
-                continue
-                
-            # Calculate volume to market cap ratio (higher is better for micro-caps)
-            volume_mc_ratio = volume_24h / market_cap if market_cap > 0 else 0
-            
-            microcaps.append({
-                'coin': coin,
-                'volume_mc_ratio': volume_mc_ratio,
-                'market_cap': market_cap,
-                'volume_24h': volume_24h
-            })
-        
-        if not microcaps:
+        # One vectorized pass over the merged pages - cap window, volume
+        # floor, and exclusion list as boolean masks, winner by argmax of
+        # the volume/market-cap ratio. No per-row candidate dicts
+        n_coins = len(markets)
+        caps = np.fromiter((c.get('market_cap') or 0 for c in markets),
+                           dtype=np.float64, count=n_coins)
+        volumes = np.fromiter((c.get('total_volume') or 0 for c in markets),
+                              dtype=np.float64, count=n_coins)
+        excluded = np.fromiter((c['id'] in MICROCAP_EXCLUDED_IDS for c in markets),
+                               dtype=bool, count=n_coins)
+
+        # $1M-$50M cap window with at least $10K daily volume
+        qualifies = (~excluded) & (caps > 1_000_000) & (caps < 50_000_000) & (volumes >= 10_000)
+        candidate_count = int(qualifies.sum())
+
+        if not candidate_count:
             return jsonify({'error': 'No qualifying micro-caps found under $50M with sufficient volume'}), 404
-        
-        # Sort by volume/market cap ratio (indicates activity relative to size)
-        microcaps.sort(key=lambda x: x['volume_mc_ratio'], reverse=True)
-        selected_data = microcaps[0]
-        selected_coin = selected_data['coin']
-        
-        logger.info(f"Selected micro-cap: {selected_coin['name']} (${selected_data['market_cap']:,.0f} MC)")
+
+        # Volume/market-cap ratio indicates activity relative to size
+        ratios = np.where(qualifies, volumes / np.maximum(caps, 1.0), -1.0)
+        winner = int(ratios.argmax())
+        selected_coin = markets[winner]
+        market_cap = float(caps[winner])
+        volume_24h = float(volumes[winner])
+
+        logger.info(f"Selected micro-cap: {selected_coin['name']} (${market_cap:,.0f} MC)")
         
         # Generate comprehensive analysis using CoinGecko Pro data
         price_change_24h = selected_coin.get('price_change_percentage_24h', 0)
@@ -670,15 +1031,8 @@ def microcap_report():
         market_cap_rank = selected_coin.get('market_cap_rank', 999)
         
         # Risk assessment based on metrics
-        volume_mc_ratio = selected_data['volume_mc_ratio']
-        if volume_mc_ratio > 0.5:
-            activity_level = "Extremely High"
-        elif volume_mc_ratio > 0.1:
-            activity_level = "High"
-        elif volume_mc_ratio > 0.05:
-            activity_level = "Moderate"
-        else:
-            activity_level = "Low"
+        volume_mc_ratio = float(ratios[winner])
+        activity_level = _ACTIVITY_LABELS[bisect.bisect_left(_ACTIVITY_THRESHOLDS, volume_mc_ratio)]
         
         # Generate intelligent catalysts based on data
         catalysts = []
@@ -696,9 +1050,9 @@ def microcap_report():
                 'name': selected_coin['name'],
                 'symbol': selected_coin['symbol'].upper(),
                 'current_price': selected_coin['current_price'],
-                'market_cap': selected_data['market_cap'],
+                'market_cap': market_cap,
                 'market_cap_rank': market_cap_rank,
-                'volume_24h': selected_data['volume_24h'],
+                'volume_24h': volume_24h,
                 'volume_mc_ratio': round(volume_mc_ratio, 4),
                 'price_change_24h': round(price_change_24h, 2),
                 'price_change_7d': round(price_change_7d, 2),
@@ -712,13 +1066,8 @@ def microcap_report():
                 'momentum_score': max(0, min(100, (price_change_7d + 50)))
             },
             'growth_catalysts': catalysts,
-            'risk_factors': [
-                'Extreme volatility due to small market cap',
-                'Limited liquidity for large position sizes',
-                'Higher susceptibility to market manipulation',
-                'Potential for significant price swings'
-            ],
-            'investment_thesis': f"Selected from {len(microcaps)} qualifying micro-caps based on trading activity and CoinGecko Pro data. Shows {activity_level.lower()} relative trading activity.",
+            'risk_factors': _MICROCAP_RISKS,
+            'investment_thesis': f"Selected from {candidate_count} qualifying micro-caps based on trading activity and CoinGecko Pro data. Shows {activity_level.lower()} relative trading activity.",
             'risk_assessment': 'VERY HIGH - Micro-cap investments are speculative',
             'analysis_time': datetime.utcnow().isoformat()
         }
@@ -727,7 +1076,7 @@ def microcap_report():
             'status': 'success',
             'analysis_type': 'Micro-Cap Analysis Report',
             'selection_criteria': 'Market cap $1M-$50M, minimum $10K daily volume, highest volume/MC ratio',
-            'total_candidates': len(microcaps),
+            'total_candidates': candidate_count,
             'data_source': 'CoinGecko Pro API',
             'report': report_data
         })
@@ -742,27 +1091,27 @@ def microcap_report():
 
 @app.route('/api/deep-dive/<ticker>')
 @limiter.limit("5 per minute")
-@cache.cached(timeout=3600)
+@cache.cached(timeout=300)  # Prices move every ~60s; the slow inputs are cached for longer below
 def deep_dive_analysis(ticker):
     """Comprehensive deep-dive analysis for specific token"""
     try:
         ticker = ticker.upper()
         
-        # Find coin by ticker
-        markets = CoinGeckoProvider.get_markets(per_page=250)
-        target_coin = None
-        
-        for coin in markets:
-            if coin['symbol'].upper() == ticker:
-                target_coin = coin
-                break
-        
+        # Find coin by ticker with one cached hash probe
+        target_coin = get_symbol_index().get(ticker)
+
         if not target_coin:
             return jsonify({'error': f'Token {ticker} not found'}), 404
         
         coin_name = target_coin['name']
         coin_id = target_coin['id']
-        
+
+        # The index row can be minutes old - refresh the numbers with one
+        # small ids= fetch rather than re-pulling a whole page
+        fresh_row = CoinGeckoProvider.get_market_by_id(coin_id)
+        if fresh_row:
+            target_coin = fresh_row
+
         # Gather comprehensive data
         analysis_data = {
             'token_info': {
@@ -772,7 +1121,8 @@ def deep_dive_analysis(ticker):
                 'market_cap': target_coin['market_cap'],
                 'volume_24h': target_coin['total_volume'],
                 'price_change_24h': target_coin.get('price_change_percentage_24h', 0),
-                'price_change_7d': target_coin.get('price_change_percentage_7d', 0),
+                'price_change_7d': target_coin.get('price_change_percentage_7d_in_currency',
+                                                   target_coin.get('price_change_percentage_7d', 0)),
                 'price_change_30d': target_coin.get('price_change_percentage_30d_in_currency', 0),
                 'coingecko_link': f"https://www.coingecko.com/en/coins/{coin_id}"
             },
@@ -788,16 +1138,8 @@ def deep_dive_analysis(ticker):
                 'whale_movements': 'Tracking...',
                 'liquidity_depth': 'Calculating...'
             },
-            'strengths': [
-                'Established market presence',
-                'Active trading volume',
-                'Available on major exchanges'
-            ],
-            'risks': [
-                'Market volatility exposure',
-                'Regulatory uncertainty',
-                'Competition from similar projects'
-            ],
+            'strengths': _DD_STRENGTHS,
+            'risks': _DD_RISKS,
             'technical_analysis': {
                 'trend': 'Analyzing price patterns...',
                 'support_level': target_coin['current_price'] * 0.85,
@@ -805,15 +1147,19 @@ def deep_dive_analysis(ticker):
             }
         }
         
+        # Overlap the two independent Velo lookups instead of waiting for
+        # one round-trip before starting the next
+        news_future = executor.submit(VeloProvider.search_news, coin_name, days=7, limit=10)
+        social_future = executor.submit(VeloProvider.get_social_sentiment, coin_name, days=7)
+
         # Fetch recent news/catalysts
         try:
-            news = VeloProvider.search_news(coin_name, days=7, limit=10)
+            news = news_future.result(timeout=30)
             analysis_data['catalysts_7d'] = [
                 {
                     'date': article.get('published_at', datetime.utcnow().isoformat())[:10],
                     'event': article.get('title', 'Market update'),
-                    'impact': 'Positive' if any(word in article.get('title', '').lower() 
-                                             for word in ['launch', 'partnership', 'listing', 'upgrade']) else 'Mixed'
+                    'impact': 'Positive' if _IMPACT_RE.search(article.get('title', '')) else 'Mixed'
                 }
                 for article in news[:5]
             ]
@@ -822,7 +1168,7 @@ def deep_dive_analysis(ticker):
         
         # Social sentiment analysis
         try:
-            social_data = VeloProvider.get_social_sentiment(coin_name, days=7)
+            social_data = social_future.result(timeout=30)
             if social_data:
                 # Mock sentiment analysis - would use real data in production
                 analysis_data['social_sentiment'] = {
@@ -865,13 +1211,7 @@ def health_check():
         'status': 'healthy',
         'timestamp': datetime.utcnow().isoformat(),
         'version': 'GPT-5 Crypto Intelligence Suite v1.0',
-        'modules': [
-            'Altcoin Outperformers',
-            'High Beta Analysis', 
-            'DeFiLlama Screener',
-            'Micro-Cap Report',
-            'Deep Dive Analysis'
-        ]
+        'modules': _MODULES
     })
 
 @app.route('/api/status')
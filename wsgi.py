@@ -0,0 +1,23 @@
+"""
+WSGI entry point for the GPT-5 Crypto Intelligence Suite backend.
+
+The Werkzeug dev server in crypto_intel_backend's __main__ block is for
+local debugging only - one process, a small thread pool, and the GIL
+serializing JSON encoding under load. In production run this module
+behind gunicorn with threaded workers so handlers overlap during the
+outbound provider calls:
+
+    gunicorn -k gthread -w 2 --threads 16 wsgi:app
+
+Use gthread rather than gevent here: the high-beta route drives its
+chart fan-out with asyncio.run over aiohttp, and under gevent
+monkey-patching that event loop would pin the worker's hub for the
+whole fan-out (or break outright, depending on the gevent/selector
+pairing). Threaded workers release the GIL during I/O, which is where
+these handlers spend nearly all of their time.
+"""
+
+from crypto_intel_backend import app
+
+if __name__ == "__main__":
+    app.run(host="localhost", port=8080)